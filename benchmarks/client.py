@@ -0,0 +1,131 @@
+"""Micro-benchmarks for the Virtualizor API client hot paths.
+
+Run from the project root: python -m benchmarks.client [name ...]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+import timeit
+
+from src.api import VirtualizorAPI
+from src.api.decoder import BACKENDS
+from src.api.stream import iter_object_members
+
+API = VirtualizorAPI(
+    "https://panel.example.com:4085/index.php", "k" * 32, "p&ss=w0rd/+" * 2
+)
+
+
+def _legacy_build_url(action: str, **params) -> str:
+    base_params = {
+        "act": action,
+        "api": "json",
+        "apikey": API.api_key,
+        "apipass": API.api_pass,
+    }
+    base_params.update(params)
+    query = "&".join(f"{k}={v}" for k, v in base_params.items())
+    return f"{API.api_url}?{query}"
+
+
+def bench_build_url():
+    number = 200_000
+    cases = {
+        "legacy unescaped": lambda: _legacy_build_url("ram", svs="1234"),
+        "pre-encoded": lambda: API._build_url("ram", svs="1234"),
+    }
+    for label, fn in cases.items():
+        elapsed = timeit.timeit(fn, number=number)
+        print(f"  {label:<18} {elapsed / number * 1e6:8.2f} us/call")
+
+
+def _listvs_payload() -> bytes:
+    # BENCH_PAYLOAD may point at a recorded listvs response; otherwise synthesize one.
+    path = os.getenv("BENCH_PAYLOAD")
+    if path:
+        with open(path, "rb") as f:
+            return f.read()
+
+    count = int(os.getenv("BENCH_VMS", "5000"))
+    vs = {
+        str(1000 + i): {
+            "vpsid": str(1000 + i),
+            "hostname": f"vm-{i:05d}.example.com",
+            "ips": {"1": f"10.0.{i // 256 % 256}.{i % 256}", "2": f"2001:db8::{i:x}"},
+            "status": i % 3 != 0,
+            "suspended": "0",
+            "cores": 2,
+            "ram": "2048",
+            "space": "40",
+            "bandwidth": "1024",
+            "used_bandwidth": i % 1024,
+            "os_name": "ubuntu-22.04-x86_64",
+            "virt": "kvm",
+            "plan": {"plid": "3", "plan_name": "Standard", "notes": "x" * 200},
+        }
+        for i in range(count)
+    }
+    return json.dumps({"vs": vs, "timenow": 0, "time_taken": "0.1"}).encode()
+
+
+def _timed(fn, rounds: int = 5) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_decode():
+    payload = _listvs_payload()
+    print(f"  payload            {len(payload) / 1024 / 1024:8.2f} MiB")
+
+    for name, factory in BACKENDS.items():
+        try:
+            loads = factory()
+        except ImportError:
+            print(f"  {name:<18} not installed")
+            continue
+
+        def decode_and_normalize():
+            vs = loads(payload).get("vs") or {}
+            return [API._normalize_vm(k, v) for k, v in vs.items()]
+
+        decode = _timed(lambda: loads(payload))
+        total = _timed(decode_and_normalize)
+        print(
+            f"  {name:<18} {decode * 1e3:8.1f} ms decode, {total * 1e3:8.1f} ms total"
+        )
+
+    text = payload.decode()
+
+    async def chunks():
+        for i in range(0, len(text), 65536):
+            yield text[i : i + 65536]
+
+    async def stream():
+        async for k, v in iter_object_members(chunks(), "vs"):
+            API._normalize_vm(k, v)
+
+    streamed = _timed(lambda: asyncio.run(stream()))
+    print(f"  {'streamed (json)':<18} {streamed * 1e3:8.1f} ms total")
+
+
+BENCHMARKS = {
+    "build_url": bench_build_url,
+    "decode": bench_decode,
+}
+
+
+def main(names):
+    for name in names or BENCHMARKS:
+        print(f"{name}:")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,64 @@
+"""Compare config lookups: connect per query, shared connection, in-memory cache.
+
+Run from the project root: python -m benchmarks.database [lookups]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import aiosqlite
+
+from src.database import Database
+
+APIS = 20
+
+
+async def _per_call_get_api(db_path: str, name: str):
+    # The query path used before Database kept a connection open.
+    async with aiosqlite.connect(db_path) as conn:
+        conn.row_factory = aiosqlite.Row
+        cursor = await conn.execute("SELECT * FROM api_configs WHERE name = ?", (name,))
+        row = await cursor.fetchone()
+        return dict(row) if row else None
+
+
+async def _shared_get_api(db: Database, name: str):
+    conn = await db._connection()
+    async with conn.execute(
+        "SELECT * FROM api_configs WHERE name = ?", (name,)
+    ) as cursor:
+        row = await cursor.fetchone()
+        return dict(row) if row else None
+
+
+async def _timed(lookup, count: int) -> float:
+    started = time.perf_counter()
+    for i in range(count):
+        await lookup(f"panel-{i % APIS}")
+    return time.perf_counter() - started
+
+
+async def main(count: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / "bench.db"))
+        await db.init()
+        for i in range(APIS):
+            await db.add_api(f"panel-{i}", "https://panel.example.com", "k", "p")
+
+        cases = {
+            "per-call connect": lambda name: _per_call_get_api(db.db_path, name),
+            "shared connection": lambda name: _shared_get_api(db, name),
+            "cached get_api": db.get_api,
+        }
+        for label, lookup in cases.items():
+            elapsed = await _timed(lookup, count)
+            print(f"  {label:<18} {elapsed / count * 1e6:8.1f} us/lookup")
+
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
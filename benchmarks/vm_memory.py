@@ -0,0 +1,51 @@
+"""Compare memory held by per-VM dicts and slotted VMInfo records.
+
+Run from the project root: python -m benchmarks.vm_memory [count]
+"""
+
+import sys
+import tracemalloc
+
+from src.api.models import VMInfo
+
+
+def _fields(i: int) -> dict:
+    return {
+        "vpsid": str(1000 + i),
+        "hostname": f"vm-{i:05d}.example.com",
+        "ipv4": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+        "ipv6": f"2001:db8::{i:x}",
+        "status": "running" if i % 3 else "stopped",
+        "vcpu": 2,
+        "ram": 2048,
+        "disk": 40,
+        "bandwidth": 1024,
+        "used_bandwidth": i % 1024,
+        "os": "ubuntu-22.04-x86_64",
+        "virt": "kvm",
+    }
+
+
+def measure(factory, count: int) -> int:
+    # Build the field values first so only the container overhead is measured.
+    rows = [_fields(i) for i in range(count)]
+    tracemalloc.start()
+    records = [factory(row) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def main(count: int = 10_000):
+    as_dict = measure(dict, count)
+    as_slots = measure(lambda row: VMInfo(**row), count)
+
+    print(f"VMs:         {count}")
+    print(f"dict:        {as_dict / 1024:10.1f} KiB ({as_dict / count:.0f} B/VM)")
+    print(f"VMInfo:      {as_slots / 1024:10.1f} KiB ({as_slots / count:.0f} B/VM)")
+    print(f"saving:      {(1 - as_slots / as_dict) * 100:10.1f} %")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -1,4 +1,48 @@
+from .cache import InventoryCache, inventory_cache
 from .client import VirtualizorAPI
-from .exceptions import APIError, APIConnectionError, AuthenticationError
+from .coalesce import SingleFlight, request_coalescer
+from .inventory import VMInventory
+from .latency import LatencyTracker, latency
+from .limiter import LimiterRegistry, PanelLimiter, TokenBucket, limiters
+from .breaker import BreakerRegistry, CircuitBreaker, breakers
+from .exceptions import (
+    APIError,
+    APIConnectionError,
+    APITimeoutError,
+    AuthenticationError,
+    PanelServerError,
+    PanelUnavailableError,
+)
+from .models import VMInfo, VMStats
+from .pool import ClientPool, http_pool
+from .registry import ClientRegistry, api_clients
 
-__all__ = ["VirtualizorAPI", "APIError", "APIConnectionError", "AuthenticationError"]
+__all__ = [
+    "VirtualizorAPI",
+    "APIError",
+    "APIConnectionError",
+    "AuthenticationError",
+    "APITimeoutError",
+    "PanelUnavailableError",
+    "PanelServerError",
+    "CircuitBreaker",
+    "BreakerRegistry",
+    "breakers",
+    "ClientPool",
+    "InventoryCache",
+    "inventory_cache",
+    "VMInventory",
+    "VMInfo",
+    "VMStats",
+    "SingleFlight",
+    "request_coalescer",
+    "LatencyTracker",
+    "latency",
+    "PanelLimiter",
+    "TokenBucket",
+    "LimiterRegistry",
+    "limiters",
+    "http_pool",
+    "ClientRegistry",
+    "api_clients",
+]
@@ -0,0 +1,74 @@
+import time
+from typing import Dict
+
+from src.config import BREAKER_THRESHOLD, BREAKER_COOLDOWN
+
+from .exceptions import PanelUnavailableError
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN
+    ):
+        self.threshold = max(threshold, 1)
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def before_call(self):
+        if self.state == self.OPEN:
+            remaining = self.cooldown - (time.monotonic() - self.opened_at)
+            if remaining > 0:
+                raise PanelUnavailableError(
+                    "Panel temporarily unavailable", retry_after=remaining
+                )
+            self.state = self.HALF_OPEN
+
+        if self.state == self.HALF_OPEN:
+            # Only one probe goes through; everyone else keeps failing fast.
+            if self._probing:
+                raise PanelUnavailableError(
+                    "Panel temporarily unavailable", retry_after=self.cooldown
+                )
+            self._probing = True
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._probing = False
+        if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def release(self):
+        self._probing = False
+
+
+class BreakerRegistry:
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, api_url: str) -> CircuitBreaker:
+        breaker = self._breakers.get(api_url)
+        if breaker is None:
+            breaker = self._breakers[api_url] = CircuitBreaker()
+        return breaker
+
+    def discard(self, api_url: str):
+        self._breakers.pop(api_url, None)
+
+    def states(self) -> Dict[str, str]:
+        return {url: breaker.state for url, breaker in self._breakers.items()}
+
+
+breakers = BreakerRegistry()
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from src.config import VM_CACHE_TTL, VM_CACHE_MAX_STALE
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+class InventoryCache:
+    def __init__(
+        self, ttl: float = VM_CACHE_TTL, max_stale: float = VM_CACHE_MAX_STALE
+    ):
+        self.ttl = ttl
+        self.max_stale = max(max_stale, ttl)
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+
+    async def get(self, key: Hashable, loader: Loader, force: bool = False) -> Any:
+        entry = self._entries.get(key)
+        if entry and not force:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl:
+                return entry[1]
+            if age < self.max_stale:
+                self._refresh_in_background(key, loader)
+                return entry[1]
+        return await self._load(key, loader)
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: Tuple):
+        size = len(prefix)
+        for key in [k for k in self._entries if isinstance(k, tuple)]:
+            if key[:size] == prefix:
+                del self._entries[key]
+
+    async def _load(self, key: Hashable, loader: Loader) -> Any:
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        started = time.monotonic()
+        async with lock:
+            # Another caller may have finished a load while we were waiting.
+            entry = self._entries.get(key)
+            if entry and entry[0] >= started:
+                return entry[1]
+            value = await loader()
+            self._entries[key] = (time.monotonic(), value)
+            return value
+
+    def _refresh_in_background(self, key: Hashable, loader: Loader):
+        if key in self._refreshing:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._load(key, loader))
+        self._refreshing[key] = task
+
+        def _done(t: asyncio.Task):
+            self._refreshing.pop(key, None)
+            if not t.cancelled() and t.exception():
+                logger.debug(f"Background inventory refresh failed: {t.exception()}")
+
+        task.add_done_callback(_done)
+
+
+inventory_cache = InventoryCache()
@@ -1,160 +1,444 @@
+import asyncio
 import base64
-from typing import Dict, Any, List
-import requests
-import urllib3
+import logging
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import islice
+from urllib.parse import quote_plus, urlencode
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
+import httpx
 
-from .exceptions import APIError, APIConnectionError, AuthenticationError
+from src.config import API_RETRIES, API_RETRY_BACKOFF, VM_PAGE_SIZE
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from .breaker import CircuitBreaker, breakers
+from .exceptions import (
+    APIError,
+    APIConnectionError,
+    APITimeoutError,
+    AuthenticationError,
+    PanelServerError,
+    PanelUnavailableError,
+)
+from .cache import inventory_cache
+from .coalesce import request_coalescer
+from .decoder import loads
+from .inventory import VMInventory
+from .latency import latency
+from .limiter import limiters
+from .models import VMInfo, VMStats
+from .pool import http_pool
+from .stream import iter_object_members
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(value: Any) -> str:
+    value = str(value)
+    # vpsids, page numbers and act names are plain alphanumerics.
+    return value if value.isascii() and value.isalnum() else quote_plus(value)
+
+
+@contextmanager
+def _translate_errors():
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        raise APITimeoutError("Connection timeout") from e
+    except httpx.TransportError as e:
+        raise APIConnectionError(f"Connection failed: {e}") from e
+    except httpx.HTTPStatusError as e:
+        status = e.response.status_code
+        if status == 401:
+            raise AuthenticationError("Invalid API credentials") from e
+        # A 5xx usually comes from a proxy whose backend is down, so count it as
+        # a connection failure for the breaker and the read retries.
+        if status >= 500:
+            raise PanelServerError(f"HTTP error: {status}", status) from e
+        # str(e) embeds the request URL, which carries the API credentials.
+        raise APIError(f"HTTP error: {status}") from e
+    except ValueError as e:
+        raise APIError("Invalid response from server") from e
+
+
+# The breaker the current call is already accounted against, if any.
+_tracking: ContextVar[Optional[CircuitBreaker]] = ContextVar("_tracking", default=None)
+
+
+@contextmanager
+def _tracked(breaker: CircuitBreaker):
+    previous = _tracking.get()
+    if previous is breaker:
+        # Retries and nested requests of one call count once toward the breaker.
+        yield
+        return
+
+    breaker.before_call()
+    _tracking.set(breaker)
+    try:
+        yield
+    except PanelServerError:
+        # A 5xx still means the panel answered; only unreachable panels trip it.
+        breaker.record_success()
+        raise
+    except APIConnectionError:
+        breaker.record_failure()
+        raise
+    except APIError:
+        # The panel answered, so it is reachable even if the call failed.
+        breaker.record_success()
+        raise
+    except BaseException:
+        breaker.release()
+        raise
+    else:
+        breaker.record_success()
+    finally:
+        _tracking.set(previous)
+
+
+async def _retry(
+    call: Callable[[], Awaitable[Any]], retries: int, breaker: CircuitBreaker
+) -> Any:
+    with _tracked(breaker):
+        attempt = 0
+        while True:
+            try:
+                return await call()
+            except (APITimeoutError, PanelUnavailableError):
+                # A timeout already spent the full budget; a retry doubles the wait.
+                raise
+            except APIConnectionError:
+                if attempt >= retries:
+                    raise
+
+            delay = API_RETRY_BACKOFF * (2**attempt)
+            await asyncio.sleep(delay + random.uniform(0, API_RETRY_BACKOFF))
+            attempt += 1
 
 
 class VirtualizorAPI:
-    TIMEOUT = 30
+    STATS_TIMEOUT = 10
+    READ_ACTIONS = frozenset({"listvs", "ram", "disk", "bandwidth", "managevdf"})
 
     def __init__(
-        self, api_url: str, api_key: str, api_pass: str, verify_ssl: bool = False
+        self,
+        api_url: str,
+        api_key: str,
+        api_pass: str,
+        verify_ssl: bool = False,
+        http2: bool = False,
     ):
         self.api_url = api_url.rstrip("/")
         self.api_key = api_key
         self.api_pass = api_pass
         self.verify_ssl = verify_ssl
+        self.http2 = http2
+        # Encoded once per client; only the per-call part is built per request.
+        self._base_query = urlencode(
+            {"api": "json", "apikey": api_key, "apipass": api_pass}
+        )
 
     @classmethod
     def from_db_config(cls, config: Dict[str, Any]) -> "VirtualizorAPI":
         api_pass = base64.b64decode(config["api_pass"]).decode()
-        return cls(config["api_url"], config["api_key"], api_pass)
+        return cls(
+            config["api_url"],
+            config["api_key"],
+            api_pass,
+            http2=bool(config.get("http2")),
+        )
 
     def _build_url(self, action: str, **params) -> str:
-        base_params = {
-            "act": action,
-            "api": "json",
-            "apikey": self.api_key,
-            "apipass": self.api_pass,
-        }
-        base_params.update(params)
-        query = "&".join(f"{k}={v}" for k, v in base_params.items())
-        return f"{self.api_url}?{query}"
-
-    def _request(self, action: str, **params) -> Dict[str, Any]:
-        url = self._build_url(action, **params)
-        try:
-            response = requests.get(url, timeout=self.TIMEOUT, verify=self.verify_ssl)
+        return self._sign(self._log_url(action, **params))
+
+    def _log_url(self, action: str, **params) -> str:
+        query = "".join(f"&{k}={_encode(v)}" for k, v in params.items())
+        return f"{self.api_url}?act={_encode(action)}{query}"
+
+    def _sign(self, log_url: str) -> str:
+        # Credentials go last so the loggable prefix is built only once.
+        return f"{log_url}&{self._base_query}"
+
+    async def _request(self, action: str, **params) -> Dict[str, Any]:
+        if action not in self.READ_ACTIONS:
+            return await self._send(action, **params)
+
+        key = (self.api_url, self.api_key, action, tuple(sorted(params.items())))
+        return await request_coalescer.do(key, lambda: self._send(action, **params))
+
+    async def _send(self, action: str, **params) -> Dict[str, Any]:
+        log_url = self._log_url(action, **params)
+        url = self._sign(log_url)
+        breaker = breakers.get(self.api_url)
+        logger.debug("GET %s", log_url)
+
+        async def attempt():
+            return await self._fetch(action, url)
+
+        retries = API_RETRIES if action in self.READ_ACTIONS else 0
+        return await _retry(attempt, retries, breaker)
+
+    async def _fetch(self, action: str, url: str) -> Dict[str, Any]:
+        timeout = latency.timeout_for(
+            self.api_url, action, write=action not in self.READ_ACTIONS
+        )
+        with _translate_errors():
+            client = http_pool.get(self.api_url, self.verify_ssl, self.http2)
+            async with limiters.get(self.api_url).slot():
+                with latency.measure(self.api_url, action, timeout):
+                    response = await client.get(url, timeout=timeout)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.Timeout as e:
-            raise APIConnectionError("Connection timeout") from e
-        except requests.exceptions.ConnectionError as e:
-            raise APIConnectionError(f"Connection failed: {e}") from e
-        except requests.exceptions.HTTPError as e:
-            if e.response is not None and e.response.status_code == 401:
-                raise AuthenticationError("Invalid API credentials") from e
-            raise APIError(f"HTTP error: {e}") from e
-        except requests.exceptions.JSONDecodeError as e:
-            raise APIError("Invalid response from server") from e
-
-    def test_connection(self) -> Dict[str, Any]:
-        response = self._request("listvs")
+            return loads(response.content)
+
+    async def _stream_members(
+        self, action: str, key: str, **params
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        log_url = self._log_url(action, **params)
+        url = self._sign(log_url)
+        breaker = breakers.get(self.api_url)
+        client = http_pool.get(self.api_url, self.verify_ssl, self.http2)
+        logger.debug("GET %s (streamed)", log_url)
+
+        timeout = latency.timeout_for(self.api_url, action)
+
+        with _tracked(breaker), _translate_errors():
+            async with limiters.get(self.api_url).slot():
+                with latency.measure(self.api_url, action, timeout):
+                    async with client.stream("GET", url, timeout=timeout) as response:
+                        response.raise_for_status()
+                        async for member in iter_object_members(
+                            response.aiter_text(), key
+                        ):
+                            yield member
+
+    async def test_connection(self, count: bool = False) -> Dict[str, Any]:
+        # A one-row page is enough to prove the credentials work.
+        response = await self._request("listvs", page=1, reslen=1)
         if "error" in response and response["error"]:
             raise AuthenticationError("Invalid API credentials")
 
-        vs_count = len(response.get("vs", {})) if response.get("vs") else 0
-        return {"success": True, "vm_count": vs_count}
-
-    def list_vms(self) -> List[Dict[str, Any]]:
-        response = self._request("listvs")
-        vs_data = response.get("vs", {})
-        if not vs_data:
-            return []
-
-        vms = []
-        for vpsid, data in vs_data.items():
-            ips = data.get("ips", {})
-            ipv4 = None
-            ipv6 = None
-            for ip in ips.values():
-                if isinstance(ip, str):
-                    if ":" in ip and not ipv6:
-                        ipv6 = ip
-                    elif "." in ip and ":" not in ip and not ipv4:
-                        ipv4 = ip
-
-            status = "stopped"
-            if data.get("status") == 1:
-                status = "running"
-            elif data.get("suspended") and str(data.get("suspended")) not in ("0", ""):
-                status = "suspended"
-
-            vms.append(
-                {
-                    "vpsid": vpsid,
-                    "hostname": data.get("hostname", ""),
-                    "ipv4": ipv4,
-                    "ipv6": ipv6,
-                    "status": status,
-                    "vcpu": data.get("cores", 0),
-                    "ram": data.get("ram", 0),
-                    "disk": data.get("space", 0),
-                    "bandwidth": data.get("bandwidth", 0),
-                    "used_bandwidth": data.get("used_bandwidth", 0),
-                    "os": data.get("os_name", ""),
-                    "virt": data.get("virt", ""),
-                }
+        vm_count = self._total_from_page(response)
+        if vm_count is None and count:
+            vm_count = len(await self.list_vms())
+        return {"success": True, "vm_count": vm_count}
+
+    @staticmethod
+    def _total_from_page(response: Dict[str, Any]) -> Optional[int]:
+        page = response.get("page")
+        if isinstance(page, dict) and "maxNum" in page:
+            try:
+                return int(page["maxNum"])
+            except (TypeError, ValueError):
+                return None
+        vs = response.get("vs") or {}
+        # More than one row means the panel ignored reslen and sent everything.
+        if len(vs) != 1:
+            return len(vs)
+        return None
+
+    async def discard(self):
+        """Drop the pooled client and per-panel state kept for this panel URL."""
+        self.invalidate_cache()
+        await http_pool.discard(self.api_url)
+        breakers.discard(self.api_url)
+        limiters.discard(self.api_url)
+        latency.discard(self.api_url)
+
+    @property
+    def _cache_key(self):
+        return (self.api_url, self.api_key)
+
+    def invalidate_cache(self):
+        inventory_cache.invalidate_prefix(self._cache_key)
+
+    async def list_vms(self, force: bool = False) -> VMInventory:
+        return await inventory_cache.get(self._cache_key, self._fetch_vms, force=force)
+
+    async def get_vm(self, vpsid: str, force: bool = False) -> Optional[VMInfo]:
+        vpsid = str(vpsid)
+        inventory = inventory_cache.peek(self._cache_key)
+        if inventory is not None and not force:
+            vm = inventory.get(vpsid)
+            if vm:
+                return vm
+
+        # Virtualizor filters listvs by vpsid, so this fetches a single record.
+        response = await self._request("listvs", vpsid=vpsid)
+        data = (response.get("vs") or {}).get(vpsid)
+        if not data:
+            return None
+
+        vm = self._normalize_vm(vpsid, data)
+        if inventory is not None:
+            inventory.add(vm)
+        return vm
+
+    async def list_vms_page(
+        self, page: int, page_size: int = VM_PAGE_SIZE, force: bool = False
+    ) -> VMInventory:
+        inventory = None if force else inventory_cache.peek(self._cache_key)
+        if inventory is not None:
+            start = (page - 1) * page_size
+            return VMInventory(islice(inventory, start, start + page_size))
+
+        key = (*self._cache_key, "page", page, page_size)
+        return await inventory_cache.get(
+            key, lambda: self._fetch_page(page, page_size), force=force
+        )
+
+    async def has_next_page(
+        self, page: int, page_size: int = VM_PAGE_SIZE, force: bool = False
+    ) -> bool:
+        offset = page * page_size
+        inventory = None if force else inventory_cache.peek(self._cache_key)
+        if inventory is not None:
+            return len(inventory) > offset
+
+        key = (*self._cache_key, "after", offset)
+        return await inventory_cache.get(
+            key, lambda: self._has_rows_after(offset), force=force
+        )
+
+    async def _has_rows_after(self, offset: int) -> bool:
+        async def attempt():
+            # With reslen=1 the page number is a row index, so this asks for
+            # just the first row of the next page.
+            rows = 0
+            async for _ in self._stream_members(
+                "listvs", "vs", page=offset + 1, reslen=1
+            ):
+                rows += 1
+            # More than one row means the panel ignored paging and sent everything.
+            return rows > offset if rows > 1 else rows == 1
+
+        return await _retry(attempt, API_RETRIES, breakers.get(self.api_url))
+
+    async def iter_pages(
+        self, page_size: int = VM_PAGE_SIZE
+    ) -> AsyncIterator[VMInventory]:
+        page = 1
+        while True:
+            inventory = await self.list_vms_page(page, page_size)
+            if inventory:
+                yield inventory
+            if len(inventory) < page_size:
+                return
+            page += 1
+
+    async def _fetch_page(self, page: int, page_size: int) -> VMInventory:
+        async def attempt():
+            start = (page - 1) * page_size
+            vms = [vm async for vm in self.iter_vms(page=page, reslen=page_size)]
+            # Panels that ignore the paging parameters return everything.
+            if len(vms) > page_size:
+                vms = vms[start : start + page_size]
+            return VMInventory(vms)
+
+        return await _retry(attempt, API_RETRIES, breakers.get(self.api_url))
+
+    async def iter_vms(self, **params) -> AsyncIterator[VMInfo]:
+        async for vpsid, data in self._stream_members("listvs", "vs", **params):
+            yield self._normalize_vm(str(vpsid), data)
+
+    async def _fetch_vms(self) -> VMInventory:
+        async def attempt():
+            inventory = VMInventory()
+            async for vm in self.iter_vms():
+                inventory.add(vm)
+            return inventory
+
+        return await _retry(attempt, API_RETRIES, breakers.get(self.api_url))
+
+    @staticmethod
+    def _normalize_vm(vpsid: str, data: Dict[str, Any]) -> VMInfo:
+        ips = data.get("ips", {})
+        ipv4 = None
+        ipv6 = None
+        for ip in ips.values():
+            if isinstance(ip, str):
+                if ":" in ip and not ipv6:
+                    ipv6 = ip
+                elif "." in ip and ":" not in ip and not ipv4:
+                    ipv4 = ip
+
+        status = "stopped"
+        if data.get("status") == 1:
+            status = "running"
+        elif data.get("suspended") and str(data.get("suspended")) not in ("0", ""):
+            status = "suspended"
+
+        return VMInfo(
+            vpsid=vpsid,
+            hostname=data.get("hostname") or "",
+            ipv4=ipv4,
+            ipv6=ipv6,
+            status=status,
+            vcpu=data.get("cores", 0),
+            ram=data.get("ram", 0),
+            disk=data.get("space", 0),
+            bandwidth=data.get("bandwidth", 0),
+            used_bandwidth=data.get("used_bandwidth", 0),
+            os=data.get("os_name", ""),
+            virt=data.get("virt", ""),
+        )
+
+    async def _fetch_stat(self, action: str, vpsid: str) -> Dict[str, Any]:
+        try:
+            return await asyncio.wait_for(
+                self._request(action, svs=vpsid), self.STATS_TIMEOUT
             )
-        return vms
-
-    def get_vm_stats(self, vpsid: str) -> Dict[str, Any]:
-        stats = {
-            "ram_used": 0,
-            "ram_total": 0,
-            "disk_used": 0,
-            "disk_total": 0,
-            "bandwidth_used": 0,
-            "bandwidth_total": 0,
-            "nw_rules": 0,
-        }
+        except Exception:
+            return {}
+
+    async def get_vm_stats(self, vpsid: str) -> VMStats:
+        stats = VMStats()
+
+        ram, disk, bw, nw = await asyncio.gather(
+            self._fetch_stat("ram", vpsid),
+            self._fetch_stat("disk", vpsid),
+            self._fetch_stat("bandwidth", vpsid),
+            self._fetch_stat("managevdf", vpsid),
+        )
 
         try:
-            ram = self._request("ram", svs=vpsid)
             if ram.get("ram"):
                 info = ram["ram"]
-                stats["ram_used"] = float(info.get("used", 0))
-                stats["ram_total"] = float(info.get("limit", 0))
+                stats.ram_used = float(info.get("used", 0))
+                stats.ram_total = float(info.get("limit", 0))
         except Exception:
             pass
 
         try:
-            disk = self._request("disk", svs=vpsid)
             if disk.get("disk"):
                 info = disk["disk"]
-                stats["disk_used"] = float(info.get("used_gb", 0))
-                stats["disk_total"] = float(info.get("limit_gb", 0))
+                stats.disk_used = float(info.get("used_gb", 0))
+                stats.disk_total = float(info.get("limit_gb", 0))
         except Exception:
             pass
 
         try:
-            bw = self._request("bandwidth", svs=vpsid)
             if bw.get("bandwidth"):
                 info = bw["bandwidth"]
-                stats["bandwidth_used"] = float(info.get("used_gb", 0))
-                stats["bandwidth_total"] = float(info.get("limit_gb", 0))
+                stats.bandwidth_used = float(info.get("used_gb", 0))
+                stats.bandwidth_total = float(info.get("limit_gb", 0))
         except Exception:
             pass
 
         try:
-            nw = self._request("managevdf", svs=vpsid)
             if nw.get("haproxydata"):
-                stats["nw_rules"] = len(nw["haproxydata"])
+                stats.nw_rules = len(nw["haproxydata"])
         except Exception:
             pass
 
         return stats
 
-    def vm_action(self, vpsid: str, action: str) -> Dict[str, Any]:
+    async def vm_action(self, vpsid: str, action: str) -> Dict[str, Any]:
         valid_actions = ["start", "stop", "restart", "poweroff"]
         if action not in valid_actions:
             raise APIError(f"Invalid action: {action}")
 
-        response = self._request(action, svs=vpsid, do=1)
+        response = await self._request(action, svs=vpsid, do=1)
 
         if "error" in response and response["error"]:
             error_msg = response.get("error", {})
@@ -0,0 +1,57 @@
+import json
+import logging
+from typing import Any, Callable, Dict, Tuple, Union
+
+from src.config import JSON_DECODER
+
+logger = logging.getLogger(__name__)
+
+Loads = Callable[[Union[bytes, str]], Any]
+
+
+def _stdlib() -> Loads:
+    return json.loads
+
+
+def _orjson() -> Loads:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec() -> Loads:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            # Callers treat ValueError as "invalid response", like json/orjson.
+            raise ValueError(str(e)) from e
+
+    return loads
+
+
+BACKENDS: Dict[str, Callable[[], Loads]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _stdlib,
+}
+
+
+def select_backend(preferred: str = "") -> Tuple[str, Loads]:
+    names = list(BACKENDS)
+    if preferred in BACKENDS:
+        names.insert(0, preferred)
+    for name in names:
+        try:
+            return name, BACKENDS[name]()
+        except ImportError:
+            if name == preferred:
+                logger.warning(f"JSON decoder '{name}' is not installed")
+    return "json", json.loads
+
+
+BACKEND, loads = select_backend(JSON_DECODER)
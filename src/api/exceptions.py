@@ -8,3 +8,19 @@ class APIConnectionError(APIError):
 
 class AuthenticationError(APIError):
     pass
+
+
+class APITimeoutError(APIConnectionError):
+    pass
+
+
+class PanelUnavailableError(APIConnectionError):
+    def __init__(self, message: str, retry_after: float = 0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class PanelServerError(APIConnectionError):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
@@ -0,0 +1,62 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .models import VMInfo
+
+
+class VMInventory:
+    def __init__(self, vms: Iterable[VMInfo] = ()):
+        self._order: List[str] = []
+        self.by_id: Dict[str, VMInfo] = {}
+        self.by_ip: Dict[str, str] = {}
+        self.by_hostname: Dict[str, str] = {}
+        for vm in vms:
+            self.add(vm)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[VMInfo]:
+        for vpsid in self._order:
+            yield self.by_id[vpsid]
+
+    def __contains__(self, vpsid: object) -> bool:
+        return vpsid in self.by_id
+
+    def add(self, vm: VMInfo):
+        vpsid = vm.vpsid
+        old = self.by_id.get(vpsid)
+        if old is None:
+            self._order.append(vpsid)
+        else:
+            self._unindex(old)
+        self.by_id[vpsid] = vm
+        self._index(vm)
+
+    def get(self, vpsid: str) -> Optional[VMInfo]:
+        return self.by_id.get(str(vpsid))
+
+    def find_by_ip(self, ip: str) -> Optional[VMInfo]:
+        vpsid = self.by_ip.get(ip)
+        return self.by_id[vpsid] if vpsid else None
+
+    def find_by_hostname(self, hostname: str) -> Optional[VMInfo]:
+        vpsid = self.by_hostname.get(hostname.lower())
+        return self.by_id[vpsid] if vpsid else None
+
+    def with_status(self, status: str) -> List[VMInfo]:
+        return [vm for vm in self if vm.status == status]
+
+    def _index(self, vm: VMInfo):
+        for ip in (vm.ipv4, vm.ipv6):
+            if ip:
+                self.by_ip[ip] = vm.vpsid
+        if vm.hostname:
+            self.by_hostname[vm.hostname.lower()] = vm.vpsid
+
+    def _unindex(self, vm: VMInfo):
+        for ip in (vm.ipv4, vm.ipv6):
+            if ip and self.by_ip.get(ip) == vm.vpsid:
+                del self.by_ip[ip]
+        hostname = vm.hostname.lower()
+        if hostname and self.by_hostname.get(hostname) == vm.vpsid:
+            del self.by_hostname[hostname]
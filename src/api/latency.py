@@ -0,0 +1,92 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Tuple
+
+import httpx
+
+from src.config import (
+    API_CONNECT_TIMEOUT,
+    API_MIN_READ_TIMEOUT,
+    API_READ_TIMEOUT,
+    API_WRITE_TIMEOUT,
+)
+
+
+class LatencyStats:
+    __slots__ = ("ewma", "samples")
+
+    ALPHA = 0.2
+
+    def __init__(self, size: int = 50):
+        self.ewma = 0.0
+        self.samples: Deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float):
+        if self.samples:
+            self.ewma += self.ALPHA * (seconds - self.ewma)
+        else:
+            self.ewma = seconds
+        self.samples.append(seconds)
+
+    def p95(self) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+
+
+class LatencyTracker:
+    MIN_SAMPLES = 5
+    HEADROOM = 3
+
+    def __init__(self):
+        self._stats: Dict[Tuple[str, str], LatencyStats] = {}
+
+    def record(self, api_url: str, action: str, seconds: float):
+        stats = self._stats.get((api_url, action))
+        if stats is None:
+            stats = self._stats[(api_url, action)] = LatencyStats()
+        stats.record(seconds)
+
+    def discard(self, api_url: str):
+        for key in [key for key in self._stats if key[0] == api_url]:
+            del self._stats[key]
+
+    def read_timeout(self, api_url: str, action: str, write: bool = False) -> float:
+        if write:
+            return API_WRITE_TIMEOUT
+
+        stats = self._stats.get((api_url, action))
+        if stats is None or len(stats.samples) < self.MIN_SAMPLES:
+            return API_READ_TIMEOUT
+
+        budget = max(stats.p95(), stats.ewma) * self.HEADROOM
+        return min(max(budget, API_MIN_READ_TIMEOUT), API_READ_TIMEOUT)
+
+    def timeout_for(
+        self, api_url: str, action: str, write: bool = False
+    ) -> httpx.Timeout:
+        read = self.read_timeout(api_url, action, write)
+        return httpx.Timeout(read, connect=API_CONNECT_TIMEOUT, pool=read)
+
+    @contextmanager
+    def measure(self, api_url: str, action: str, timeout: httpx.Timeout):
+        started = time.monotonic()
+        try:
+            yield
+        except httpx.TimeoutException:
+            # Count the spent budget so a panel that got slower earns a longer one.
+            self.record(api_url, action, timeout.read or API_READ_TIMEOUT)
+            raise
+        else:
+            self.record(api_url, action, time.monotonic() - started)
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        return {
+            key: {"ewma": stats.ewma, "p95": stats.p95(), "samples": len(stats.samples)}
+            for key, stats in self._stats.items()
+        }
+
+
+latency = LatencyTracker()
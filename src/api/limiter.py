@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict
+
+from src.config import API_MAX_CONCURRENCY, API_RATE_LIMIT, API_RATE_BURST
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class PanelLimiter:
+    def __init__(
+        self,
+        max_concurrency: int = API_MAX_CONCURRENCY,
+        rate: float = API_RATE_LIMIT,
+        burst: int = API_RATE_BURST,
+    ):
+        self._semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        self._bucket = TokenBucket(rate, burst)
+        self.max_concurrency = max(max_concurrency, 1)
+        self.waiting = 0
+        self.active = 0
+        self.requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        try:
+            await self._bucket.acquire()
+            waited = time.monotonic() - started
+            self.requests += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            if waited > 1:
+                logger.debug(
+                    f"Waited {waited:.1f}s for a panel slot ({self.waiting} queued)"
+                )
+            self.active += 1
+            try:
+                yield
+            finally:
+                self.active -= 1
+        finally:
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "waiting": self.waiting,
+            "active": self.active,
+            "requests": self.requests,
+            "avg_wait": self.total_wait / self.requests if self.requests else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class LimiterRegistry:
+    def __init__(self):
+        self._limiters: Dict[str, PanelLimiter] = {}
+
+    def get(self, api_url: str) -> PanelLimiter:
+        limiter = self._limiters.get(api_url)
+        if limiter is None:
+            limiter = self._limiters[api_url] = PanelLimiter()
+        return limiter
+
+    def discard(self, api_url: str):
+        self._limiters.pop(api_url, None)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {url: limiter.stats() for url, limiter in self._limiters.items()}
+
+
+limiters = LimiterRegistry()
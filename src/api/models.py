@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class VMInfo:
+    vpsid: str
+    hostname: str = ""
+    ipv4: Optional[str] = None
+    ipv6: Optional[str] = None
+    status: str = "stopped"
+    vcpu: int = 0
+    ram: float = 0
+    disk: float = 0
+    bandwidth: float = 0
+    used_bandwidth: float = 0
+    os: str = ""
+    virt: str = ""
+
+
+@dataclass(slots=True)
+class VMStats:
+    ram_used: float = 0
+    ram_total: float = 0
+    disk_used: float = 0
+    disk_total: float = 0
+    bandwidth_used: float = 0
+    bandwidth_total: float = 0
+    nw_rules: int = 0
@@ -0,0 +1,50 @@
+import logging
+from typing import Dict, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class ClientPool:
+    LIMITS = httpx.Limits(
+        max_connections=20, max_keepalive_connections=10, keepalive_expiry=60
+    )
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, bool, bool], httpx.AsyncClient] = {}
+
+    def get(
+        self, api_url: str, verify_ssl: bool = False, http2: bool = False
+    ) -> httpx.AsyncClient:
+        # Configs for one panel URL may differ in options; each needs its own client.
+        key = (api_url, verify_ssl, http2)
+        client = self._clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+
+        try:
+            client = httpx.AsyncClient(
+                verify=verify_ssl, limits=self.LIMITS, http2=http2
+            )
+        except ImportError:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+            client = httpx.AsyncClient(verify=verify_ssl, limits=self.LIMITS)
+        self._clients[key] = client
+        return client
+
+    async def discard(self, api_url: str):
+        for key in [key for key in self._clients if key[0] == api_url]:
+            await self._clients.pop(key).aclose()
+
+    async def close(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+http_pool = ClientPool()
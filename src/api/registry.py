@@ -0,0 +1,27 @@
+from typing import Any, Dict, Optional
+
+from .client import VirtualizorAPI
+
+
+class ClientRegistry:
+    def __init__(self):
+        self._clients: Dict[str, VirtualizorAPI] = {}
+
+    def get(self, api_config: Dict[str, Any]) -> VirtualizorAPI:
+        api = self._clients.get(api_config["name"])
+        if api is None:
+            api = VirtualizorAPI.from_db_config(api_config)
+            self._clients[api_config["name"]] = api
+        return api
+
+    def invalidate(self, name: Optional[str] = None):
+        if name is None:
+            self._clients.clear()
+        else:
+            self._clients.pop(name, None)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+api_clients = ClientRegistry()
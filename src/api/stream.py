@@ -0,0 +1,104 @@
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Tuple
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+_NUMBER_TAIL = ".eE+-"
+
+
+class _Reader:
+    def __init__(self, chunks: AsyncIterable[str]):
+        self._chunks = chunks.__aiter__()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    async def _more(self) -> bool:
+        if self.eof:
+            return False
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self.eof = True
+            return False
+        # Drop everything already consumed so the buffer only holds pending data.
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    async def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not await self._more():
+                return ""
+
+    async def expect(self, char: str):
+        found = await self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, got {found!r}")
+        self.pos += 1
+
+    async def separator(self, closing: str) -> bool:
+        found = await self.peek()
+        self.pos += 1
+        if found == closing:
+            return False
+        if found != ",":
+            raise ValueError(f"Expected ',' or {closing!r}, got {found!r}")
+        return True
+
+    async def value(self) -> Any:
+        await self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not await self._more():
+                    raise
+                continue
+            # A number at the end of the buffer, or one stopped by a "." or an
+            # exponent marker, may continue in the next chunk.
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                rest = self.buf[end : end + 1]
+                if (not rest or rest in _NUMBER_TAIL) and await self._more():
+                    continue
+            self.pos = end
+            return value
+
+
+async def iter_object_members(
+    chunks: AsyncIterable[str], key: str
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Yield the members of the top-level object ``key`` while the body streams in.
+
+    Only one member of ``key`` is held in memory at a time; other top-level
+    values are decoded and discarded.
+    """
+    reader = _Reader(chunks)
+    await reader.expect("{")
+    if await reader.peek() == "}":
+        return
+
+    while True:
+        name = await reader.value()
+        await reader.expect(":")
+
+        if name == key and await reader.peek() == "{":
+            reader.pos += 1
+            if await reader.peek() == "}":
+                reader.pos += 1
+            else:
+                while True:
+                    member = await reader.value()
+                    await reader.expect(":")
+                    yield member, await reader.value()
+                    if not await reader.separator("}"):
+                        break
+        else:
+            await reader.value()
+
+        if not await reader.separator("}"):
+            return
@@ -7,19 +7,38 @@ from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 
 from src.config import BOT_TOKEN, ALLOWED_USER_IDS
+from src.api import api_clients, http_pool, limiters, request_coalescer
 from src.database import db
 from src.logger import setup_logger, print_banner
-from src.routers import base_router, api_router, vm_router
+from src.routers import base_router, api_router, vm_router, bulk_router
 
 logger = setup_logger()
 
 
 async def on_startup():
+    db.add_listener(api_clients.invalidate)
     await db.init()
     logger.info("Database initialized")
     logger.info("Bot is ready and listening for updates")
 
 
+async def on_shutdown():
+    stats = request_coalescer.stats()
+    logger.info(
+        f"Panel reads: {stats['calls']} requested, "
+        f"{stats['deduplicated']} served by in-flight calls"
+    )
+    for api_url, panel in limiters.stats().items():
+        logger.debug(
+            f"{api_url}: {panel['requests']} requests, "
+            f"avg wait {panel['avg_wait']:.2f}s, max wait {panel['max_wait']:.2f}s"
+        )
+    await http_pool.close()
+    logger.info("API connections closed")
+    await db.close()
+    logger.info("Database connection closed")
+
+
 async def main(debug=False):
     if not BOT_TOKEN:
         raise ValueError("BOT_TOKEN not set")
@@ -44,8 +63,10 @@ async def main(debug=False):
     dp.include_router(base_router)
     dp.include_router(api_router)
     dp.include_router(vm_router)
+    dp.include_router(bulk_router)
 
     dp.startup.register(on_startup)
+    dp.shutdown.register(on_shutdown)
 
     logger.info("Configuration loaded")
     logger.info(f"Authorized users: {ALLOWED_USER_IDS}")
@@ -9,3 +9,32 @@ _allowed_users = os.getenv("ALLOWED_USER_IDS", os.getenv("ALLOWED_USER_ID", ""))
 ALLOWED_USER_IDS = [int(uid.strip()) for uid in _allowed_users.split(",") if uid.strip().isdigit()]
 
 DATABASE_PATH = os.getenv("DATABASE_PATH", "data/bot.db")
+
+VM_CACHE_TTL = float(os.getenv("VM_CACHE_TTL", "60"))
+VM_CACHE_MAX_STALE = float(os.getenv("VM_CACHE_MAX_STALE", "600"))
+VM_PAGE_SIZE = int(os.getenv("VM_PAGE_SIZE", "10"))
+ALL_PANELS_TIMEOUT = float(os.getenv("ALL_PANELS_TIMEOUT", "15"))
+
+API_RETRIES = int(os.getenv("API_RETRIES", "2"))
+API_RETRY_BACKOFF = float(os.getenv("API_RETRY_BACKOFF", "0.5"))
+BREAKER_THRESHOLD = int(os.getenv("BREAKER_THRESHOLD", "3"))
+BREAKER_COOLDOWN = float(os.getenv("BREAKER_COOLDOWN", "30"))
+
+API_MAX_CONCURRENCY = int(os.getenv("API_MAX_CONCURRENCY", "4"))
+API_RATE_LIMIT = float(os.getenv("API_RATE_LIMIT", "10"))
+API_RATE_BURST = int(os.getenv("API_RATE_BURST", "10"))
+
+JSON_DECODER = os.getenv("JSON_DECODER", "").strip().lower()
+
+API_CONNECT_TIMEOUT = float(os.getenv("API_CONNECT_TIMEOUT", "3"))
+API_READ_TIMEOUT = float(os.getenv("API_READ_TIMEOUT", "30"))
+API_MIN_READ_TIMEOUT = float(os.getenv("API_MIN_READ_TIMEOUT", "5"))
+API_WRITE_TIMEOUT = float(os.getenv("API_WRITE_TIMEOUT", "60"))
+
+BULK_ACTION_CONCURRENCY = int(os.getenv("BULK_ACTION_CONCURRENCY", "5"))
+BATCH_ADD_MAX = int(os.getenv("BATCH_ADD_MAX", "200"))
+BATCH_ADD_CONCURRENCY = int(os.getenv("BATCH_ADD_CONCURRENCY", "10"))
+
+ACTION_POLL_INTERVAL = float(os.getenv("ACTION_POLL_INTERVAL", "2"))
+ACTION_POLL_MAX_INTERVAL = float(os.getenv("ACTION_POLL_MAX_INTERVAL", "10"))
+ACTION_POLL_TIMEOUT = float(os.getenv("ACTION_POLL_TIMEOUT", "120"))
@@ -1,3 +1,4 @@
 from .manager import Database, db
+from .migrations import SCHEMA_VERSION, migrate
 
-__all__ = ["Database", "db"]
+__all__ = ["Database", "db", "SCHEMA_VERSION", "migrate"]
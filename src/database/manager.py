@@ -1,107 +1,200 @@
+import asyncio
 import aiosqlite
 import base64
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Callable, Tuple
 
 from src.config import DATABASE_PATH
+from .migrations import migrate
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+)
 
 
 class Database:
     def __init__(self, db_path: str = DATABASE_PATH):
         self.db_path = db_path
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._apis: Optional[Dict[str, Dict[str, Any]]] = None
+        self._names_lower: Set[str] = set()
+        self._listeners: List[Callable[[Optional[str]], None]] = []
         self._ensure_dir()
 
     def _ensure_dir(self):
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
+    async def _connection(self) -> aiosqlite.Connection:
+        if self._conn is None:
+            async with self._connect_lock:
+                if self._conn is None:
+                    conn = await aiosqlite.connect(self.db_path)
+                    conn.row_factory = aiosqlite.Row
+                    for pragma in PRAGMAS:
+                        await conn.execute(pragma)
+                    self._conn = conn
+        return self._conn
+
+    @asynccontextmanager
+    async def _transaction(self):
+        # Writes share one connection, so they must not interleave their commits.
+        conn = await self._connection()
+        async with self._write_lock:
+            try:
+                yield conn
+                await conn.commit()
+            except BaseException:
+                # The cache may already hold this transaction's changes.
+                self.invalidate()
+                await conn.rollback()
+                raise
+
+    async def _cache(self) -> Dict[str, Dict[str, Any]]:
+        if self._apis is None:
+            conn = await self._connection()
+            async with conn.execute("SELECT * FROM api_configs") as cursor:
+                rows = [dict(row) for row in await cursor.fetchall()]
+            # A write may have filled the cache while the query was running.
+            if self._apis is None:
+                self._apis = {row["name"]: row for row in rows}
+                self._names_lower = {name.lower() for name in self._apis}
+        return self._apis
+
+    def invalidate(self):
+        """Drop cached rows so the next read reloads them from SQLite."""
+        self._apis = None
+        self._names_lower = set()
+        self._notify(None)
+
+    def add_listener(self, listener: Callable[[Optional[str]], None]):
+        """Call ``listener(name)`` when a config changes, ``None`` for all."""
+        self._listeners.append(listener)
+
+    def _notify(self, name: Optional[str]):
+        for listener in self._listeners:
+            listener(name)
+
+    async def close(self):
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
     async def init(self):
-        async with aiosqlite.connect(self.db_path) as conn:
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS api_configs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    api_url TEXT NOT NULL,
-                    api_key TEXT NOT NULL,
-                    api_pass TEXT NOT NULL,
-                    is_default INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """
-            )
-            await conn.commit()
+        async with self._transaction() as conn:
+            await migrate(conn)
+        self.invalidate()
+        await self._cache()
 
     async def add_api(
         self, name: str, api_url: str, api_key: str, api_pass: str
     ) -> bool:
         encoded_pass = base64.b64encode(api_pass.encode()).decode()
-        async with aiosqlite.connect(self.db_path) as conn:
-            cursor = await conn.execute("SELECT COUNT(*) FROM api_configs")
-            count = (await cursor.fetchone())[0]
-            is_default = 1 if count == 0 else 0
+        async with self._transaction() as conn:
+            apis = await self._cache()
+            is_default = 1 if not apis else 0
 
-            await conn.execute(
+            async with conn.execute(
                 "INSERT INTO api_configs (name, api_url, api_key, api_pass, is_default) VALUES (?, ?, ?, ?, ?)",
                 (name, api_url, api_key, encoded_pass, is_default),
+            ) as cursor:
+                row_id = cursor.lastrowid
+            async with conn.execute(
+                "SELECT * FROM api_configs WHERE id = ?", (row_id,)
+            ) as cursor:
+                apis[name] = dict(await cursor.fetchone())
+            self._names_lower.add(name.lower())
+        self._notify(name)
+        return True
+
+    async def add_apis(self, apis: List[Tuple[str, str, str, str]]) -> List[str]:
+        async with self._transaction() as conn:
+            cached = await self._cache()
+            rows = []
+            names = set(self._names_lower)
+            for name, api_url, api_key, api_pass in apis:
+                if name.lower() in names:
+                    continue
+                names.add(name.lower())
+                encoded_pass = base64.b64encode(api_pass.encode()).decode()
+                is_default = 1 if not cached and not rows else 0
+                rows.append((name, api_url, api_key, encoded_pass, is_default))
+
+            await conn.executemany(
+                "INSERT INTO api_configs (name, api_url, api_key, api_pass, is_default) VALUES (?, ?, ?, ?, ?)",
+                rows,
             )
-            await conn.commit()
-            return True
+            async with conn.execute("SELECT * FROM api_configs") as cursor:
+                for row in await cursor.fetchall():
+                    cached[row["name"]] = dict(row)
+            self._names_lower = names
+        added = [row[0] for row in rows]
+        for name in added:
+            self._notify(name)
+        return added
 
     async def get_api(self, name: str) -> Optional[Dict[str, Any]]:
-        async with aiosqlite.connect(self.db_path) as conn:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute(
-                "SELECT * FROM api_configs WHERE name = ?", (name,)
-            )
-            row = await cursor.fetchone()
-            return dict(row) if row else None
+        row = (await self._cache()).get(name)
+        return dict(row) if row else None
 
     async def get_default_api(self) -> Optional[Dict[str, Any]]:
-        async with aiosqlite.connect(self.db_path) as conn:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute(
-                "SELECT * FROM api_configs WHERE is_default = 1"
-            )
-            row = await cursor.fetchone()
-            return dict(row) if row else None
+        for row in (await self._cache()).values():
+            if row["is_default"]:
+                return dict(row)
+        return None
 
     async def list_apis(self) -> List[Dict[str, Any]]:
-        async with aiosqlite.connect(self.db_path) as conn:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute("SELECT * FROM api_configs ORDER BY name")
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        apis = await self._cache()
+        return [dict(apis[name]) for name in sorted(apis)]
 
     async def delete_api(self, name: str) -> bool:
-        async with aiosqlite.connect(self.db_path) as conn:
-            cursor = await conn.execute(
+        async with self._transaction() as conn:
+            apis = await self._cache()
+            async with conn.execute(
                 "DELETE FROM api_configs WHERE name = ?", (name,)
-            )
-            await conn.commit()
-            return cursor.rowcount > 0
+            ) as cursor:
+                deleted = cursor.rowcount > 0
+            apis.pop(name, None)
+            self._names_lower = {api_name.lower() for api_name in apis}
+        self._notify(name)
+        return deleted
 
     async def set_default(self, name: str) -> bool:
-        async with aiosqlite.connect(self.db_path) as conn:
+        async with self._transaction() as conn:
+            apis = await self._cache()
             await conn.execute("UPDATE api_configs SET is_default = 0")
-            cursor = await conn.execute(
+            async with conn.execute(
                 "UPDATE api_configs SET is_default = 1 WHERE name = ?", (name,)
-            )
-            await conn.commit()
-            return cursor.rowcount > 0
+            ) as cursor:
+                updated = cursor.rowcount > 0
+            for row in apis.values():
+                row["is_default"] = 1 if row["name"] == name else 0
+            return updated
+
+    async def set_http2(self, name: str, enabled: bool) -> bool:
+        async with self._transaction() as conn:
+            apis = await self._cache()
+            async with conn.execute(
+                "UPDATE api_configs SET http2 = ? WHERE name = ?",
+                (1 if enabled else 0, name),
+            ) as cursor:
+                updated = cursor.rowcount > 0
+            if name in apis:
+                apis[name]["http2"] = 1 if enabled else 0
+        self._notify(name)
+        return updated
 
     async def api_exists(self, name: str) -> bool:
-        async with aiosqlite.connect(self.db_path) as conn:
-            cursor = await conn.execute(
-                "SELECT 1 FROM api_configs WHERE name = ?", (name,)
-            )
-            return await cursor.fetchone() is not None
+        return name in await self._cache()
 
     async def api_exists_case_insensitive(self, name: str) -> bool:
-        async with aiosqlite.connect(self.db_path) as conn:
-            cursor = await conn.execute(
-                "SELECT 1 FROM api_configs WHERE LOWER(name) = LOWER(?)", (name,)
-            )
-            return await cursor.fetchone() is not None
+        await self._cache()
+        return name.lower() in self._names_lower
 
 
 db = Database()
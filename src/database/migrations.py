@@ -0,0 +1,81 @@
+from typing import Awaitable, Callable, List
+
+import aiosqlite
+
+Migration = Callable[[aiosqlite.Connection], Awaitable[None]]
+
+
+async def _create_api_configs(conn: aiosqlite.Connection):
+    await conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS api_configs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL,
+            api_url TEXT NOT NULL,
+            api_key TEXT NOT NULL,
+            api_pass TEXT NOT NULL,
+            is_default INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """
+    )
+
+
+async def _add_http2_column(conn: aiosqlite.Connection):
+    async with conn.execute("PRAGMA table_info(api_configs)") as cursor:
+        columns = {row[1] for row in await cursor.fetchall()}
+    if "http2" not in columns:
+        await conn.execute("ALTER TABLE api_configs ADD COLUMN http2 INTEGER DEFAULT 0")
+
+
+async def _add_lookup_indexes(conn: aiosqlite.Connection):
+    try:
+        await conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_api_configs_name_nocase "
+            "ON api_configs (name COLLATE NOCASE)"
+        )
+    except aiosqlite.IntegrityError:
+        # Names that differ only by case already exist; keep them reachable.
+        await conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_api_configs_name_nocase "
+            "ON api_configs (name COLLATE NOCASE)"
+        )
+
+    await conn.execute(
+        "UPDATE api_configs SET is_default = 0 WHERE is_default = 1 AND id != "
+        "(SELECT MIN(id) FROM api_configs WHERE is_default = 1)"
+    )
+    await conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_api_configs_default "
+        "ON api_configs (is_default) WHERE is_default = 1"
+    )
+
+
+# Append only: a database at version N has run the first N entries. Steps are
+# written to be idempotent because schemas created before versioning carry
+# some of these changes without a version number.
+MIGRATIONS: List[Migration] = [
+    _create_api_configs,
+    _add_http2_column,
+    _add_lookup_indexes,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+async def _user_version(conn: aiosqlite.Connection) -> int:
+    async with conn.execute("PRAGMA user_version") as cursor:
+        return (await cursor.fetchone())[0]
+
+
+async def migrate(conn: aiosqlite.Connection) -> int:
+    """Bring the schema up to SCHEMA_VERSION; the caller commits."""
+    if await _user_version(conn) >= SCHEMA_VERSION:
+        return SCHEMA_VERSION
+
+    # Take the write lock before re-reading, in case another process migrated.
+    await conn.execute("BEGIN IMMEDIATE")
+    version = await _user_version(conn)
+    for number in range(version, SCHEMA_VERSION):
+        await MIGRATIONS[number](conn)
+        await conn.execute(f"PRAGMA user_version = {number + 1}")
+    return max(version, SCHEMA_VERSION)
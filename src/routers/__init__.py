@@ -1,5 +1,6 @@
 from .base import router as base_router
 from .api_management import router as api_router
 from .vm_management import router as vm_router
+from .bulk_actions import router as bulk_router
 
-__all__ = ["base_router", "api_router", "vm_router"]
+__all__ = ["base_router", "api_router", "vm_router", "bulk_router"]
@@ -1,9 +1,17 @@
+import asyncio
+
 from aiogram import Router, F
-from aiogram.types import Message, CallbackQuery, InlineKeyboardButton
+from aiogram.types import (
+    Message,
+    CallbackQuery,
+    InlineKeyboardButton,
+    BufferedInputFile,
+)
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 
+from src.config import BATCH_ADD_CONCURRENCY, BATCH_ADD_MAX
 from src.database import db
 from src.api import VirtualizorAPI, APIError, APIConnectionError, AuthenticationError
 from src.routers.base import (
@@ -12,11 +20,17 @@ from src.routers.base import (
     get_nav_buttons,
     FOOTER,
 )
+from src.routers.vm_management import progress_bar
 
 router = Router()
 
 TITLE_ADD_API = "*Add New API*\n━━━━━━━━━━━━━━━━━━━━━\n\n"
 TITLE_API_MGMT = "*API Management*\n━━━━━━━━━━━━━━━━━━━━━\n\n"
+PROGRESS_INTERVAL = 2
+# Headroom under Telegram's 4096-character message limit.
+REPORT_LIMIT = 3800
+# Generous per-line allowance for "name|url|key|password" when sizing batch files.
+BATCH_LINE_BYTES = 512
 
 
 async def delete_user_message(message):
@@ -293,7 +307,7 @@ async def input_pass(message: Message, state: FSMContext):
 
     try:
         api = VirtualizorAPI(url, key, api_pass)
-        result = api.test_connection()
+        result = await api.test_connection(count=True)
         await db.add_api(name, url, key, api_pass)
 
         text = (
@@ -398,13 +412,61 @@ async def api_batch_add_start(callback: CallbackQuery, state: FSMContext):
         "\\- Use `|` as separator\n"
         "\\- One API per line\n"
         "\\- All fields required\n"
-        "\\- Max 10 APIs per batch\n\n"
-        "Paste your APIs below:" + FOOTER
+        f"\\- Max {BATCH_ADD_MAX} APIs per batch\n\n"
+        "Paste your APIs below, or send them as a \\.txt file:" + FOOTER
     )
     await callback.message.edit_text(text, reply_markup=get_cancel_keyboard())
     await state.set_state(BatchAPIForm.batch_input)
 
 
+def _parse_batch_line(line, taken):
+    parts = line.split("|")
+    if len(parts) != 4:
+        return None, "Invalid format"
+
+    name, url, key, password = [p.strip() for p in parts]
+
+    if not name or len(name) < 2:
+        return name, "Name too short"
+    if len(name) > 50:
+        return name, "Name too long"
+    if not all(c.isalnum() or c in " -_" for c in name):
+        return name, "Invalid characters"
+    if name.lower() in taken:
+        return name, "Already exists"
+    if not url.startswith("https://"):
+        return name, "URL must be HTTPS"
+    if len(key) < 10 or len(password) < 5:
+        return name, "Invalid credentials"
+
+    taken.add(name.lower())
+    return (name, url, key, password), None
+
+
+def _batch_document_error(document):
+    name = (document.file_name or "").lower()
+    mime = document.mime_type or ""
+    if not (name.endswith(".txt") or mime.startswith("text/")):
+        return "Only plain text \\(\\.txt\\) files are accepted\\."
+    limit = BATCH_ADD_MAX * BATCH_LINE_BYTES
+    if document.file_size and document.file_size > limit:
+        return (
+            f"The file is too large \\({document.file_size // 1024} KB\\)\\. "
+            f"Batch files may be at most {limit // 1024} KB "
+            f"\\({BATCH_ADD_MAX} APIs\\)\\."
+        )
+    return None
+
+
+async def _read_batch_lines(message: Message):
+    if message.document:
+        data = await message.bot.download(message.document)
+        content = data.read().decode("utf-8", errors="replace")
+    else:
+        content = message.text or ""
+    return [line.strip() for line in content.strip().split("\n") if line.strip()]
+
+
 @router.message(BatchAPIForm.batch_input)
 async def batch_input_process(message: Message, state: FSMContext):
     await delete_user_message(message)
@@ -412,7 +474,22 @@ async def batch_input_process(message: Message, state: FSMContext):
     data = await state.get_data()
     bot_msg_id = data.get("bot_msg_id")
 
-    lines = [line.strip() for line in message.text.strip().split("\n") if line.strip()]
+    error = _batch_document_error(message.document) if message.document else None
+    if error:
+        text = (
+            "*Batch Add APIs*\n"
+            "━━━━━━━━━━━━━━━━━━━━━\n\n"
+            "_File rejected\\._\n\n" + error + FOOTER
+        )
+        await message.bot.edit_message_text(
+            text,
+            chat_id=message.chat.id,
+            message_id=bot_msg_id,
+            reply_markup=get_cancel_keyboard(),
+        )
+        return
+
+    lines = await _read_batch_lines(message)
 
     if not lines:
         text = (
@@ -429,12 +506,12 @@ async def batch_input_process(message: Message, state: FSMContext):
         )
         return
 
-    if len(lines) > 10:
+    if len(lines) > BATCH_ADD_MAX:
         text = (
             "*Batch Add APIs*\n"
             "━━━━━━━━━━━━━━━━━━━━━\n\n"
             f"_Too many APIs \\({len(lines)}\\)\\._\n\n"
-            "Maximum 10 APIs per batch\\.\n"
+            f"Maximum {BATCH_ADD_MAX} APIs per batch\\.\n"
             "Please reduce the number and try again\\." + FOOTER
         )
         await message.bot.edit_message_text(
@@ -445,103 +522,42 @@ async def batch_input_process(message: Message, state: FSMContext):
         )
         return
 
-    text = (
-        "*Batch Add APIs*\n"
-        "━━━━━━━━━━━━━━━━━━━━━\n\n"
-        f"_Processing {len(lines)} API\\(s\\)\\.\\.\\._"
-    )
-    await message.bot.edit_message_text(
-        text, chat_id=message.chat.id, message_id=bot_msg_id
-    )
-
-    results = []
-    success_count = 0
-    failed_count = 0
-
-    for idx, line in enumerate(lines, 1):
-        parts = line.split("|")
-
-        if len(parts) != 4:
-            results.append(f"{idx}\\. \\[FAIL\\] Invalid format")
-            failed_count += 1
-            continue
-
-        name, url, key, password = [p.strip() for p in parts]
-
-        if not name or len(name) < 2:
-            results.append(
-                f"{idx}\\. \\[FAIL\\] `{escape_md(name[:20])}` \\- Name too short"
-            )
-            failed_count += 1
-            continue
-
-        if len(name) > 50:
-            results.append(
-                f"{idx}\\. \\[FAIL\\] `{escape_md(name[:20])}` \\- Name too long"
-            )
-            failed_count += 1
-            continue
-
-        if not all(c.isalnum() or c in " -_" for c in name):
-            results.append(
-                f"{idx}\\. \\[FAIL\\] `{escape_md(name[:20])}` \\- Invalid characters"
-            )
-            failed_count += 1
-            continue
-
-        if await db.api_exists_case_insensitive(name):
-            results.append(
-                f"{idx}\\. \\[FAIL\\] `{escape_md(name[:20])}` \\- Already exists"
-            )
-            failed_count += 1
-            continue
-
-        if not url.startswith("https://"):
-            results.append(
-                f"{idx}\\. \\[FAIL\\] `{escape_md(name[:20])}` \\- URL must be HTTPS"
-            )
-            failed_count += 1
-            continue
-
-        if len(key) < 10 or len(password) < 5:
-            results.append(
-                f"{idx}\\. \\[FAIL\\] `{escape_md(name[:20])}` \\- Invalid credentials"
-            )
-            failed_count += 1
-            continue
-
-        try:
-            api = VirtualizorAPI(url, key, password)
-            result = api.test_connection()
-            await db.add_api(name, url, key, password)
-            results.append(
-                f"{idx}\\. \\[OK\\] `{escape_md(name[:20])}` \\- {result['vm_count']} VMs"
-            )
-            success_count += 1
-        except APIConnectionError:
-            results.append(
-                f"{idx}\\. \\[FAIL\\] `{escape_md(name[:20])}` \\- Connection failed"
-            )
-            failed_count += 1
-        except AuthenticationError:
-            results.append(
-                f"{idx}\\. \\[FAIL\\] `{escape_md(name[:20])}` \\- Auth failed"
-            )
-            failed_count += 1
-        except Exception as e:
-            results.append(f"{idx}\\. \\[FAIL\\] `{escape_md(name[:20])}` \\- Error")
-            failed_count += 1
-
+    await state.set_state(None)
+
+    taken = {api["name"].lower() for api in await db.list_apis()}
+    results = [None] * len(lines)
+    candidates = []
+    for idx, line in enumerate(lines):
+        entry, error = _parse_batch_line(line, taken)
+        if error:
+            results[idx] = (False, entry, error)
+        else:
+            candidates.append((idx, entry))
+
+    validated = await _validate_batch(message, bot_msg_id, candidates, results)
+
+    added = set(await db.add_apis([entry for _, entry, _ in validated]))
+    await _discard_unsaved_panels(candidates, added)
+    for idx, entry, vm_count in validated:
+        name = entry[0]
+        if name in added:
+            found = f"{vm_count} VMs" if vm_count is not None else None
+            results[idx] = (True, name, found)
+        else:
+            results[idx] = (False, name, "Already exists")
+
+    success_count = len(added)
+    failed_count = len(results) - success_count
     summary = f"{success_count} succeeded, {failed_count} failed"
 
     text = (
-        "*Batch Add Results*\n"
-        "━━━━━━━━━━━━━━━━━━━━━\n\n"
-        f"*Summary:* {summary}\n\n" + "\n".join(results[:15])
+        "*Batch Add Results*\n" "━━━━━━━━━━━━━━━━━━━━━\n\n" f"*Summary:* {summary}\n\n"
     )
-
-    if len(results) > 15:
-        text += f"\n\n_\\.\\.\\. and {len(results) - 15} more_"
+    shown = _batch_result_lines(results, REPORT_LIMIT - len(text) - len(FOOTER))
+    text += "\n".join(shown)
+    hidden = len(results) - len(shown)
+    if hidden:
+        text += f"\n\n_\\.\\.\\. and {hidden} more, see the attached report_"
 
     text += FOOTER
 
@@ -557,9 +573,122 @@ async def batch_input_process(message: Message, state: FSMContext):
         reply_markup=builder.as_markup(),
     )
 
+    if hidden:
+        report = "\n".join(
+            _format_batch_result(idx, *result) for idx, result in enumerate(results)
+        )
+        await message.answer_document(
+            BufferedInputFile(report.encode(), filename="batch_add_report.txt"),
+            caption=f"Batch add report: {summary}",
+            parse_mode=None,
+        )
+
     await state.clear()
 
 
+def _format_batch_result(idx, ok, name, detail, markdown=False):
+    status = "OK" if ok else "FAIL"
+    if not markdown:
+        line = f"{idx + 1}. [{status}]"
+        if name:
+            line += f" {name}"
+        if detail:
+            line += f" - {detail}" if name else f" {detail}"
+        return line
+
+    line = f"{idx + 1}\\. \\[{status}\\]"
+    if name:
+        line += f" `{escape_md(name[:20])}`"
+    if detail:
+        line += f" \\- {escape_md(detail)}" if name else f" {escape_md(detail)}"
+    return line
+
+
+def _batch_result_lines(results, budget):
+    # Failures first: they are what the operator has to act on.
+    order = sorted(range(len(results)), key=lambda idx: results[idx][0])
+    lines = []
+    for idx in order:
+        line = _format_batch_result(idx, *results[idx], markdown=True)
+        budget -= len(line) + 1
+        if budget < 80:
+            break
+        lines.append(line)
+    return lines
+
+
+async def _discard_unsaved_panels(candidates, added):
+    # Probing every line pooled a client per URL; keep only those now in use.
+    in_use = {api["api_url"].rstrip("/") for api in await db.list_apis()}
+    for _, (name, url, key, password) in candidates:
+        api = VirtualizorAPI(url, key, password)
+        if name not in added and api.api_url not in in_use:
+            in_use.add(api.api_url)
+            await api.discard()
+
+
+async def _validate_batch(message: Message, bot_msg_id, candidates, results):
+    semaphore = asyncio.Semaphore(max(BATCH_ADD_CONCURRENCY, 1))
+    validated = []
+    finished = asyncio.Event()
+    done = 0
+
+    async def check(idx, entry):
+        nonlocal done
+        name, url, key, password = entry
+        async with semaphore:
+            try:
+                result = await VirtualizorAPI(url, key, password).test_connection()
+                validated.append((idx, entry, result["vm_count"]))
+            except APIConnectionError:
+                error = "Connection failed"
+            except AuthenticationError:
+                error = "Auth failed"
+            except Exception:
+                error = "Error"
+            else:
+                error = None
+        if error:
+            results[idx] = (False, name, error)
+        done += 1
+
+    def progress_text():
+        total = len(candidates)
+        return (
+            "*Batch Add APIs*\n"
+            "━━━━━━━━━━━━━━━━━━━━━\n\n"
+            f"_Testing {total} API\\(s\\)\\.\\.\\._\n\n"
+            f"`{progress_bar(done, total)}` {done}/{total}\n"
+            f"{len(validated)} reachable, {done - len(validated)} failed"
+        )
+
+    async def report_progress():
+        last = None
+        while not finished.is_set():
+            text = progress_text()
+            if text != last:
+                try:
+                    await message.bot.edit_message_text(
+                        text, chat_id=message.chat.id, message_id=bot_msg_id
+                    )
+                    last = text
+                except Exception:
+                    pass
+            try:
+                await asyncio.wait_for(finished.wait(), PROGRESS_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    reporter = asyncio.create_task(report_progress())
+    try:
+        await asyncio.gather(*(check(idx, entry) for idx, entry in candidates))
+    finally:
+        finished.set()
+        await reporter
+
+    return sorted(validated, key=lambda item: item[0])
+
+
 @router.callback_query(F.data == "api_list")
 async def api_list(callback: CallbackQuery):
     await callback.answer()
@@ -594,9 +723,10 @@ async def api_list(callback: CallbackQuery):
     )
     for api in apis:
         default = " _\\[default\\]_" if api["is_default"] else ""
+        http2 = " _\\[HTTP/2\\]_" if api.get("http2") else ""
         escaped_name = escape_md(api["name"])
         escaped_url = escape_md(api["api_url"])
-        text += f"*{escaped_name}*{default}\n`{escaped_url}`\n\n"
+        text += f"*{escaped_name}*{default}{http2}\n`{escaped_url}`\n\n"
 
     text += FOOTER
 
@@ -747,3 +877,79 @@ async def api_default_confirm(callback: CallbackQuery):
     builder.adjust(2)
 
     await callback.message.edit_text(text, reply_markup=builder.as_markup())
+
+
+def _build_http2_menu(apis):
+    builder = InlineKeyboardBuilder()
+    for api in apis:
+        state = "on" if api.get("http2") else "off"
+        builder.button(
+            text=f"{api['name']} [{state}]", callback_data=f"apih2_{api['name']}"
+        )
+    builder.adjust(2)
+
+    nav_builder = InlineKeyboardBuilder()
+    for btn in get_nav_buttons("menu_api", True):
+        nav_builder.add(btn)
+    nav_builder.adjust(2)
+
+    builder.attach(nav_builder)
+    return builder
+
+
+@router.callback_query(F.data == "api_http2")
+async def api_http2_start(callback: CallbackQuery):
+    await callback.answer()
+
+    if not auth_check(callback.from_user.id):
+        return
+
+    apis = await db.list_apis()
+
+    if not apis:
+        text = (
+            "*HTTP/2*\n"
+            "━━━━━━━━━━━━━━━━━━━━━\n\n"
+            "_No APIs configured\\._\n\n"
+            "You need to add an API connection first\\." + FOOTER
+        )
+        builder = InlineKeyboardBuilder()
+        for btn in get_nav_buttons("menu_api", True):
+            builder.add(btn)
+        builder.adjust(2)
+        await callback.message.edit_text(text, reply_markup=builder.as_markup())
+        return
+
+    text = (
+        "*HTTP/2*\n"
+        "━━━━━━━━━━━━━━━━━━━━━\n\n"
+        "Select an API connection to toggle HTTP/2\\.\n"
+        "With HTTP/2 all requests to a panel share one multiplexed connection\\. "
+        "Keep it off for panels behind proxies that only speak HTTP/1\\.1\\." + FOOTER
+    )
+    await callback.message.edit_text(
+        text, reply_markup=_build_http2_menu(apis).as_markup()
+    )
+
+
+@router.callback_query(F.data.startswith("apih2_"))
+async def api_http2_toggle(callback: CallbackQuery):
+    if not auth_check(callback.from_user.id):
+        await callback.answer()
+        return
+
+    name = callback.data.replace("apih2_", "")
+    api_config = await db.get_api(name)
+
+    if not api_config:
+        await callback.answer("API not found")
+        return
+
+    enabled = not api_config.get("http2")
+    await db.set_http2(name, enabled)
+    await callback.answer(f"HTTP/2 {'enabled' if enabled else 'disabled'} for {name}")
+
+    apis = await db.list_apis()
+    await callback.message.edit_reply_markup(
+        reply_markup=_build_http2_menu(apis).as_markup()
+    )
@@ -72,7 +72,10 @@ def get_api_menu():
         InlineKeyboardButton(text="List APIs", callback_data="api_list"),
         InlineKeyboardButton(text="Set Default", callback_data="api_default"),
     )
-    builder.row(InlineKeyboardButton(text="Delete API", callback_data="api_delete"))
+    builder.row(
+        InlineKeyboardButton(text="Delete API", callback_data="api_delete"),
+        InlineKeyboardButton(text="HTTP/2", callback_data="api_http2"),
+    )
     builder.row(InlineKeyboardButton(text=BTN_BACK, callback_data="menu_main"))
 
     return builder.as_markup()
@@ -147,7 +150,8 @@ async def show_api_menu(callback: CallbackQuery):
         "*Add API* \\- Register a new Virtualizor panel connection\\.\n"
         "*List APIs* \\- View all saved API configurations\\.\n"
         "*Set Default* \\- Choose which API to use by default\\.\n"
-        "*Delete API* \\- Remove an API connection\\.\n\n"
+        "*Delete API* \\- Remove an API connection\\.\n"
+        "*HTTP/2* \\- Multiplex requests to a panel over one connection\\.\n\n"
         "Select an option to continue\\." + FOOTER
     )
 
@@ -0,0 +1,400 @@
+import asyncio
+from itertools import islice
+
+from aiogram import Router, F
+from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery, InlineKeyboardButton
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from src.config import BULK_ACTION_CONCURRENCY, VM_PAGE_SIZE
+from src.database import db
+from src.api import VirtualizorAPI, APIError, api_clients
+from src.routers.base import auth_check, get_nav_buttons, FOOTER
+from src.routers.vm_management import escape_md, progress_bar, _handle_vm_list_error
+
+router = Router()
+
+TITLE_BULK = "*Bulk Actions*\n━━━━━━━━━━━━━━━━━━━━━\n\n"
+PROGRESS_INTERVAL = 2
+
+FILTER_NAMES = {
+    "running": "All running VMs",
+    "stopped": "All stopped VMs",
+    "all": "All VMs",
+    "selected": "Selected VMs",
+}
+FILTER_ACTIONS = {
+    "running": ["restart", "stop", "poweroff"],
+    "stopped": ["start"],
+    "all": ["start", "restart", "stop", "poweroff"],
+    "selected": ["start", "restart", "stop", "poweroff"],
+}
+ACTION_LABELS = {
+    "start": "Start",
+    "restart": "Restart",
+    "stop": "Stop",
+    "poweroff": "Power Off",
+}
+ACTION_PROGRESS = {
+    "start": "Starting",
+    "restart": "Restarting",
+    "stop": "Stopping",
+    "poweroff": "Powering off",
+}
+
+
+async def _load_api(callback: CallbackQuery, state: FSMContext):
+    data = await state.get_data()
+    api_name = data.get("bulk_api")
+    api_config = await db.get_api(api_name) if api_name else None
+    if not api_config:
+        await callback.answer("Bulk session expired")
+        return None, data
+    return api_clients.get(api_config), data
+
+
+async def _resolve_targets(
+    api: VirtualizorAPI, data: dict, force: bool = False
+) -> list:
+    inventory = await api.list_vms(force=force)
+    vm_filter = data.get("bulk_filter")
+    if vm_filter == "selected":
+        selected = set(data.get("bulk_selected", []))
+        return [vm for vm in inventory if vm.vpsid in selected]
+    if vm_filter == "all":
+        return list(inventory)
+    return inventory.with_status(vm_filter)
+
+
+def _back_to(callback_data: str):
+    builder = InlineKeyboardBuilder()
+    for btn in get_nav_buttons(callback_data, True):
+        builder.add(btn)
+    builder.adjust(2)
+    return builder
+
+
+@router.callback_query(F.data.startswith("vmbulk_"))
+async def bulk_start(callback: CallbackQuery, state: FSMContext):
+    await callback.answer()
+
+    if not auth_check(callback.from_user.id):
+        return
+
+    api_name = callback.data.replace("vmbulk_", "")
+    data = await state.get_data()
+    selected = data.get("bulk_selected", []) if data.get("bulk_api") == api_name else []
+    await state.update_data(
+        bulk_api=api_name, bulk_selected=selected, bulk_confirmed=None
+    )
+
+    text = (
+        TITLE_BULK + f"*API:* `{escape_md(api_name)}`\n\n"
+        "Run a power action on many VMs at once\\.\n"
+        "Choose which VMs to include\\." + FOOTER
+    )
+
+    builder = InlineKeyboardBuilder()
+    builder.button(text="All Running", callback_data="vmbf_running")
+    builder.button(text="All Stopped", callback_data="vmbf_stopped")
+    builder.button(text="All VMs", callback_data="vmbf_all")
+    builder.button(text="Select VMs", callback_data="vmbs_1")
+    builder.adjust(2)
+    builder.attach(_back_to(f"vmapi_{api_name}"))
+
+    await callback.message.edit_text(text, reply_markup=builder.as_markup())
+
+
+@router.callback_query(F.data.startswith("vmbs_"))
+async def bulk_select(callback: CallbackQuery, state: FSMContext):
+    if not auth_check(callback.from_user.id):
+        return
+
+    page = int(callback.data.replace("vmbs_", ""))
+    await _show_selection(callback, state, page)
+
+
+@router.callback_query(F.data.startswith("vmbt_"))
+async def bulk_toggle(callback: CallbackQuery, state: FSMContext):
+    if not auth_check(callback.from_user.id):
+        return
+
+    _, page, vpsid = callback.data.split("_", 2)
+    data = await state.get_data()
+    selected = list(data.get("bulk_selected", []))
+    if vpsid in selected:
+        selected.remove(vpsid)
+    else:
+        selected.append(vpsid)
+    await state.update_data(bulk_selected=selected)
+
+    await _show_selection(callback, state, int(page))
+
+
+async def _show_selection(callback: CallbackQuery, state: FSMContext, page: int):
+    api, data = await _load_api(callback, state)
+    if api is None:
+        return
+    await callback.answer()
+
+    api_name = data["bulk_api"]
+    selected = set(data.get("bulk_selected", []))
+
+    try:
+        inventory = await api.list_vms()
+    except APIError as e:
+        text, builder = _handle_vm_list_error(e)
+        await callback.message.edit_text(text, reply_markup=builder.as_markup())
+        return
+
+    start = (page - 1) * VM_PAGE_SIZE
+    vms = list(islice(inventory, start, start + VM_PAGE_SIZE))
+
+    text = (
+        TITLE_BULK + f"*API:* `{escape_md(api_name)}`\n"
+        f"*Selected:* {len(selected)} VM\\(s\\)\n\n"
+        "Tap VMs to add or remove them from the selection\\." + FOOTER
+    )
+
+    builder = InlineKeyboardBuilder()
+    for vm in vms:
+        mark = "[x]" if vm.vpsid in selected else "[ ]"
+        name = vm.hostname[:15] + ".." if len(vm.hostname) > 15 else vm.hostname
+        builder.button(text=f"{mark} {name}", callback_data=f"vmbt_{page}_{vm.vpsid}")
+    builder.adjust(2)
+
+    pager = []
+    if page > 1:
+        pager.append(
+            InlineKeyboardButton(text="< Prev", callback_data=f"vmbs_{page - 1}")
+        )
+    if start + VM_PAGE_SIZE < len(inventory):
+        pager.append(
+            InlineKeyboardButton(text="Next >", callback_data=f"vmbs_{page + 1}")
+        )
+    if pager:
+        builder.row(*pager)
+
+    if selected:
+        builder.row(
+            InlineKeyboardButton(
+                text=f"Continue ({len(selected)})", callback_data="vmbf_selected"
+            )
+        )
+    builder.attach(_back_to(f"vmbulk_{api_name}"))
+
+    await callback.message.edit_text(text, reply_markup=builder.as_markup())
+
+
+@router.callback_query(F.data.startswith("vmbf_"))
+async def bulk_filter(callback: CallbackQuery, state: FSMContext):
+    if not auth_check(callback.from_user.id):
+        return
+
+    vm_filter = callback.data.replace("vmbf_", "")
+    if vm_filter not in FILTER_ACTIONS:
+        await callback.answer("Invalid filter")
+        return
+
+    await state.update_data(bulk_filter=vm_filter)
+    api, data = await _load_api(callback, state)
+    if api is None:
+        return
+    await callback.answer()
+
+    api_name = data["bulk_api"]
+    try:
+        targets = await _resolve_targets(api, data)
+    except APIError as e:
+        text, builder = _handle_vm_list_error(e)
+        await callback.message.edit_text(text, reply_markup=builder.as_markup())
+        return
+
+    if not targets:
+        text = (
+            TITLE_BULK + f"*API:* `{escape_md(api_name)}`\n"
+            f"*Target:* {FILTER_NAMES[vm_filter]}\n\n"
+            "_No VMs match this selection\\._" + FOOTER
+        )
+        builder = _back_to(f"vmbulk_{api_name}")
+        await callback.message.edit_text(text, reply_markup=builder.as_markup())
+        return
+
+    text = (
+        TITLE_BULK + f"*API:* `{escape_md(api_name)}`\n"
+        f"*Target:* {FILTER_NAMES[vm_filter]} \\({len(targets)}\\)\n\n"
+        "Choose the action to run\\." + FOOTER
+    )
+
+    builder = InlineKeyboardBuilder()
+    for action in FILTER_ACTIONS[vm_filter]:
+        builder.button(text=ACTION_LABELS[action], callback_data=f"vmbx_{action}")
+    builder.adjust(2)
+    builder.attach(_back_to(f"vmbulk_{api_name}"))
+
+    await callback.message.edit_text(text, reply_markup=builder.as_markup())
+
+
+@router.callback_query(F.data.startswith("vmbx_"))
+async def bulk_confirm(callback: CallbackQuery, state: FSMContext):
+    if not auth_check(callback.from_user.id):
+        return
+
+    action = callback.data.replace("vmbx_", "")
+    if action not in ACTION_LABELS:
+        await callback.answer("Invalid action")
+        return
+
+    api, data = await _load_api(callback, state)
+    if api is None:
+        return
+    await callback.answer()
+
+    api_name = data["bulk_api"]
+    try:
+        targets = await _resolve_targets(api, data, force=True)
+    except APIError as e:
+        text, builder = _handle_vm_list_error(e)
+        await callback.message.edit_text(text, reply_markup=builder.as_markup())
+        return
+
+    # Execute runs on exactly what was shown here, even if states change meanwhile.
+    await state.update_data(
+        bulk_confirmed={
+            "action": action,
+            "targets": [[vm.vpsid, vm.hostname] for vm in targets],
+        }
+    )
+
+    preview = "\n".join(f"\\- `{escape_md(vm.hostname)}`" for vm in targets[:10])
+    if len(targets) > 10:
+        preview += f"\n_\\.\\.\\. and {len(targets) - 10} more_"
+
+    text = (
+        TITLE_BULK + f"*API:* `{escape_md(api_name)}`\n"
+        f"*Action:* {ACTION_LABELS[action]}\n"
+        f"*VMs:* {len(targets)}\n\n"
+        f"{preview}\n\n"
+        "_Confirm to run this action on all listed VMs\\._" + FOOTER
+    )
+
+    builder = InlineKeyboardBuilder()
+    builder.row(
+        InlineKeyboardButton(text="Confirm", callback_data=f"vmbgo_{action}"),
+        InlineKeyboardButton(text="Cancel", callback_data=f"vmbulk_{api_name}"),
+    )
+
+    await callback.message.edit_text(text, reply_markup=builder.as_markup())
+
+
+@router.callback_query(F.data.startswith("vmbgo_"))
+async def bulk_execute(callback: CallbackQuery, state: FSMContext):
+    if not auth_check(callback.from_user.id):
+        return
+
+    action = callback.data.replace("vmbgo_", "")
+    if action not in ACTION_LABELS:
+        await callback.answer("Invalid action")
+        return
+
+    api, data = await _load_api(callback, state)
+    if api is None:
+        return
+
+    confirmed = data.get("bulk_confirmed")
+    if not confirmed or confirmed["action"] != action:
+        await callback.answer("Confirmation expired")
+        return
+    await callback.answer()
+
+    api_name = data["bulk_api"]
+    targets = confirmed["targets"]
+    await state.update_data(bulk_selected=[], bulk_filter=None, bulk_confirmed=None)
+
+    errors = await _run_bulk_action(
+        callback, api, [vpsid for vpsid, _ in targets], action
+    )
+    api.invalidate_cache()
+
+    failed = sum(1 for vpsid, _ in targets if errors.get(vpsid))
+    lines = []
+    for vpsid, hostname in targets:
+        error = errors.get(vpsid)
+        if error:
+            lines.append(
+                f"\\[FAIL\\] `{escape_md(hostname[:20])}` \\- {escape_md(error[:40])}"
+            )
+        else:
+            lines.append(f"\\[OK\\] `{escape_md(hostname[:20])}`")
+
+    text = (
+        "*Bulk Action Results*\n"
+        "━━━━━━━━━━━━━━━━━━━━━\n\n"
+        f"*API:* `{escape_md(api_name)}`\n"
+        f"*Action:* {ACTION_LABELS[action]}\n"
+        f"*Summary:* {len(targets) - failed} succeeded, {failed} failed\n\n"
+        + "\n".join(lines[:30])
+    )
+    if len(lines) > 30:
+        text += f"\n\n_\\.\\.\\. and {len(lines) - 30} more_"
+    text += FOOTER
+
+    builder = InlineKeyboardBuilder()
+    builder.row(
+        InlineKeyboardButton(text="Refresh List", callback_data=f"vmref_{api_name}_1")
+    )
+    builder.attach(_back_to(f"vmbulk_{api_name}"))
+
+    await callback.message.edit_text(text, reply_markup=builder.as_markup())
+
+
+async def _run_bulk_action(
+    callback: CallbackQuery, api: VirtualizorAPI, vpsids: list, action: str
+) -> dict:
+    semaphore = asyncio.Semaphore(max(BULK_ACTION_CONCURRENCY, 1))
+    errors = {}
+    finished = asyncio.Event()
+    done = 0
+
+    async def run_one(vpsid):
+        nonlocal done
+        async with semaphore:
+            try:
+                await api.vm_action(vpsid, action)
+                errors[vpsid] = None
+            except APIError as e:
+                errors[vpsid] = str(e) or "Error"
+        done += 1
+
+    def progress_text():
+        failed = sum(1 for error in errors.values() if error)
+        return (
+            TITLE_BULK
+            + f"_{ACTION_PROGRESS[action]} {len(vpsids)} VM\\(s\\)\\.\\.\\._\n\n"
+            f"`{progress_bar(done, len(vpsids))}` {done}/{len(vpsids)}\n"
+            f"{done - failed} succeeded, {failed} failed"
+        )
+
+    async def report_progress():
+        last = None
+        while not finished.is_set():
+            text = progress_text()
+            if text != last:
+                try:
+                    await callback.message.edit_text(text)
+                    last = text
+                except Exception:
+                    pass
+            try:
+                await asyncio.wait_for(finished.wait(), PROGRESS_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    reporter = asyncio.create_task(report_progress())
+    try:
+        await asyncio.gather(*(run_one(vpsid) for vpsid in vpsids))
+    finally:
+        finished.set()
+        await reporter
+
+    return errors
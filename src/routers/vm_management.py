@@ -1,10 +1,25 @@
 import asyncio
+import logging
+
 from aiogram import Router, F
 from aiogram.types import CallbackQuery, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from src.config import (
+    ACTION_POLL_INTERVAL,
+    ACTION_POLL_MAX_INTERVAL,
+    ACTION_POLL_TIMEOUT,
+    ALL_PANELS_TIMEOUT,
+    VM_PAGE_SIZE,
+)
 from src.database import db
-from src.api import VirtualizorAPI, APIError, APIConnectionError, AuthenticationError
+from src.api import (
+    api_clients,
+    APIError,
+    APIConnectionError,
+    AuthenticationError,
+    PanelUnavailableError,
+)
 from src.routers.base import (
     auth_check,
     get_nav_buttons,
@@ -13,6 +28,10 @@ from src.routers.base import (
 )
 
 router = Router()
+logger = logging.getLogger(__name__)
+
+_background_tasks = set()
+_status_pollers = {}
 
 TITLE_VM = "*Virtual Machines*\n━━━━━━━━━━━━━━━━━━━━━\n\n"
 
@@ -130,7 +149,8 @@ async def show_vms_menu(callback: CallbackQuery):
 
     text = (
         TITLE_VM + "You have multiple API servers configured\\.\n"
-        "Select which Virtualizor panel to view VMs from\\.\n\n"
+        "Select which Virtualizor panel to view VMs from, "
+        "or *All Panels* to see every VM in one list\\.\n\n"
         "_\\* indicates default API_" + FOOTER
     )
 
@@ -141,6 +161,7 @@ async def show_vms_menu(callback: CallbackQuery):
             text=f"{api['name']}{default}", callback_data=f"vmapi_{api['name']}"
         )
     builder.adjust(2)
+    builder.row(InlineKeyboardButton(text="All Panels", callback_data="vmall_1"))
 
     builder.row(InlineKeyboardButton(text=BTN_BACK, callback_data="menu_main"))
 
@@ -172,65 +193,117 @@ async def vm_select_api(callback: CallbackQuery):
     await _show_vm_list(callback, api_config)
 
 
-def _build_vm_list_text(vms, escaped_api_name):
-    text = (
-        f"*Virtual Machines* \\({len(vms)}\\)\n"
-        "━━━━━━━━━━━━━━━━━━━━━\n\n"
-        f"*API:* `{escaped_api_name}`\n\n"
-        "Select a VM to view details\\.\n"
-        "● Running  ○ Stopped  ◌ Suspended\n\n"
-    )
+@router.callback_query(F.data.startswith("vmref_"))
+async def vm_refresh_list(callback: CallbackQuery):
+    await callback.answer()
 
+    if not auth_check(callback.from_user.id):
+        return
+
+    api_name, _, page = callback.data.replace("vmref_", "").rpartition("_")
+    api_config = await db.get_api(api_name)
+
+    if not api_config:
+        await show_vms_menu(callback)
+        return
+
+    await _show_vm_list(callback, api_config, page=int(page), force=True)
+
+
+@router.callback_query(F.data.startswith("vmpg_"))
+async def vm_list_page(callback: CallbackQuery):
+    await callback.answer()
+
+    if not auth_check(callback.from_user.id):
+        return
+
+    api_name, _, page = callback.data.replace("vmpg_", "").rpartition("_")
+    api_config = await db.get_api(api_name)
+
+    if not api_config:
+        await show_vms_menu(callback)
+        return
+
+    await _show_vm_list(callback, api_config, page=int(page))
+
+
+def _build_vm_list_text(vms, escaped_api_name, page=1):
+    # Single pass so callers can hand in a generator as well as an inventory.
+    entries = []
     for vm in vms:
-        if vm["status"] == "running":
+        if vm.status == "running":
             status_icon = "●"
-        elif vm["status"] == "suspended":
+        elif vm.status == "suspended":
             status_icon = "◌"
         else:
             status_icon = "○"
 
-        hostname = escape_md(vm["hostname"])
-        ip = escape_md(vm["ipv4"] or "No IP")
-        vcpu = vm.get("vcpu", 0)
-        ram = format_ram(vm.get("ram", 0))
-        disk = format_size(vm.get("disk", 0))
-        sys_os = escape_md(get_os_name(vm.get("os", "")))
+        hostname = escape_md(vm.hostname)
+        ip = escape_md(vm.ipv4 or "No IP")
+        vcpu = vm.vcpu
+        ram = format_ram(vm.ram)
+        disk = format_size(vm.disk)
+        sys_os = escape_md(get_os_name(vm.os))
 
-        text += (
+        entries.append(
             f"{status_icon} *{hostname}*\n"
             f"    `{ip}`\n"
             f"    {sys_os}\n"
             f"    {vcpu} vCPU \\| {escape_md(ram)} RAM \\| {escape_md(disk)} Storage\n\n"
         )
 
+    text = (
+        "*Virtual Machines*\n"
+        "━━━━━━━━━━━━━━━━━━━━━\n\n"
+        f"*API:* `{escaped_api_name}`\n"
+        f"*Page:* {page}\n\n"
+        "Select a VM to view details\\.\n"
+        "● Running  ○ Stopped  ◌ Suspended\n\n"
+    )
+    text += "".join(entries)
     text += FOOTER
     return text
 
 
-def _build_vm_list_buttons(vms, api_config):
+def _build_vm_list_buttons(vms, api_config, page=1, has_next=False):
     builder = InlineKeyboardBuilder()
 
     for vm in vms:
-        if vm["status"] == "running":
+        if vm.status == "running":
             status_icon = "●"
-        elif vm["status"] == "suspended":
+        elif vm.status == "suspended":
             status_icon = "◌"
         else:
             status_icon = "○"
 
-        btn_name = (
-            vm["hostname"][:15] + ".." if len(vm["hostname"]) > 15 else vm["hostname"]
-        )
+        btn_name = vm.hostname[:15] + ".." if len(vm.hostname) > 15 else vm.hostname
         builder.button(
             text=f"{status_icon} {btn_name}",
-            callback_data=f"vm_{api_config['name']}_{vm['vpsid']}",
+            callback_data=f"vm_{api_config['name']}_{vm.vpsid}",
         )
 
     builder.adjust(2)
-    builder.row(
-        InlineKeyboardButton(
-            text="Refresh", callback_data=f"vmapi_{api_config['name']}"
+
+    api_name = api_config["name"]
+    pager = []
+    if page > 1:
+        pager.append(
+            InlineKeyboardButton(
+                text="< Prev", callback_data=f"vmpg_{api_name}_{page - 1}"
+            )
+        )
+    if has_next:
+        pager.append(
+            InlineKeyboardButton(
+                text="Next >", callback_data=f"vmpg_{api_name}_{page + 1}"
+            )
         )
+    if pager:
+        builder.row(*pager)
+
+    builder.row(
+        InlineKeyboardButton(text="Refresh", callback_data=f"vmref_{api_name}_{page}"),
+        InlineKeyboardButton(text="Bulk Actions", callback_data=f"vmbulk_{api_name}"),
     )
 
     nav_builder = InlineKeyboardBuilder()
@@ -243,7 +316,16 @@ def _build_vm_list_buttons(vms, api_config):
 
 
 def _handle_vm_list_error(error):
-    if isinstance(error, APIConnectionError):
+    if isinstance(error, PanelUnavailableError):
+        text = (
+            "*Panel Unavailable*\n"
+            "━━━━━━━━━━━━━━━━━━━━━\n\n"
+            "The Virtualizor panel is temporarily unavailable after "
+            "repeated connection failures\\.\n\n"
+            f"_Try again in about {int(error.retry_after) + 1} second\\(s\\)\\._"
+            + FOOTER
+        )
+    elif isinstance(error, APIConnectionError):
         text = (
             f"*Connection Error*\n"
             "━━━━━━━━━━━━━━━━━━━━━\n\n"
@@ -273,7 +355,9 @@ def _handle_vm_list_error(error):
     return text, builder
 
 
-async def _show_vm_list(callback: CallbackQuery, api_config: dict):
+async def _show_vm_list(
+    callback: CallbackQuery, api_config: dict, page: int = 1, force: bool = False
+):
     api_name = api_config["name"]
     escaped_api_name = escape_md(api_name)
 
@@ -281,8 +365,16 @@ async def _show_vm_list(callback: CallbackQuery, api_config: dict):
     await callback.message.edit_text(text)
 
     try:
-        api = VirtualizorAPI.from_db_config(api_config)
-        vms = api.list_vms()
+        api = api_clients.get(api_config)
+        vms = await api.list_vms_page(page, force=force)
+
+        # The list shrank under this page; show the last page that still has VMs.
+        if not vms and page > 1:
+            page -= 1
+            vms = await api.list_vms_page(page)
+            if not vms and page > 1:
+                page = 1
+                vms = await api.list_vms_page(page)
 
         if not vms:
             text = (
@@ -297,8 +389,14 @@ async def _show_vm_list(callback: CallbackQuery, api_config: dict):
             await callback.message.edit_text(text, reply_markup=builder.as_markup())
             return
 
-        text = _build_vm_list_text(vms, escaped_api_name)
-        builder = _build_vm_list_buttons(vms, api_config)
+        has_next = len(vms) >= VM_PAGE_SIZE and await api.has_next_page(
+            page, force=force
+        )
+        if has_next:
+            _prefetch(api.list_vms_page(page + 1))
+
+        text = _build_vm_list_text(vms, escaped_api_name, page)
+        builder = _build_vm_list_buttons(vms, api_config, page, has_next)
         await callback.message.edit_text(text, reply_markup=builder.as_markup())
 
     except (APIConnectionError, AuthenticationError, APIError) as e:
@@ -306,37 +404,171 @@ async def _show_vm_list(callback: CallbackQuery, api_config: dict):
         await callback.message.edit_text(text, reply_markup=builder.as_markup())
 
 
+def _prefetch(coro):
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+
+    def _done(t):
+        _background_tasks.discard(t)
+        if not t.cancelled():
+            t.exception()
+
+    task.add_done_callback(_done)
+
+
+async def _load_all_panels(apis):
+    async def load(api_config):
+        api = api_clients.get(api_config)
+        # Shielded so a slow panel keeps loading into the cache for the next view.
+        task = asyncio.create_task(api.list_vms())
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return await asyncio.wait_for(asyncio.shield(task), ALL_PANELS_TIMEOUT)
+
+    results = await asyncio.gather(
+        *(load(api_config) for api_config in apis), return_exceptions=True
+    )
+
+    entries = []
+    failed = []
+    for api_config, result in zip(apis, results):
+        if isinstance(result, asyncio.TimeoutError):
+            failed.append((api_config["name"], "timeout"))
+        elif isinstance(result, Exception):
+            failed.append((api_config["name"], "error"))
+        else:
+            entries.extend((api_config["name"], vm) for vm in result)
+
+    entries.sort(key=lambda entry: (entry[1].hostname.lower(), entry[0]))
+    return entries, failed
+
+
+def _build_all_panels_text(entries, failed, page, pages, panel_count):
+    start = (page - 1) * VM_PAGE_SIZE
+
+    text = (
+        f"*All Panels* \\({len(entries)} VMs\\)\n"
+        "━━━━━━━━━━━━━━━━━━━━━\n\n"
+        f"*Panels:* {panel_count - len(failed)}/{panel_count} responded\n"
+        f"*Page:* {page}/{pages}\n"
+    )
+    if failed:
+        unavailable = ", ".join(
+            f"`{escape_md(name)}` \\({reason}\\)" for name, reason in failed
+        )
+        text += f"*Unavailable:* {unavailable}\n"
+    text += "\n● Running  ○ Stopped  ◌ Suspended\n\n"
+
+    for api_name, vm in entries[start : start + VM_PAGE_SIZE]:
+        if vm.status == "running":
+            status_icon = "●"
+        elif vm.status == "suspended":
+            status_icon = "◌"
+        else:
+            status_icon = "○"
+
+        text += (
+            f"{status_icon} *{escape_md(vm.hostname)}*\n"
+            f"    `{escape_md(vm.ipv4 or 'No IP')}` \\| {escape_md(api_name)}\n\n"
+        )
+
+    text += FOOTER
+    return text
+
+
+def _build_all_panels_buttons(entries, page, pages):
+    builder = InlineKeyboardBuilder()
+    start = (page - 1) * VM_PAGE_SIZE
+
+    for api_name, vm in entries[start : start + VM_PAGE_SIZE]:
+        btn_name = vm.hostname[:15] + ".." if len(vm.hostname) > 15 else vm.hostname
+        builder.button(text=btn_name, callback_data=f"vm_{api_name}_{vm.vpsid}")
+    builder.adjust(2)
+
+    pager = []
+    if page > 1:
+        pager.append(
+            InlineKeyboardButton(text="< Prev", callback_data=f"vmall_{page - 1}")
+        )
+    if page < pages:
+        pager.append(
+            InlineKeyboardButton(text="Next >", callback_data=f"vmall_{page + 1}")
+        )
+    if pager:
+        builder.row(*pager)
+
+    builder.row(InlineKeyboardButton(text="Refresh", callback_data=f"vmallr_{page}"))
+
+    nav_builder = InlineKeyboardBuilder()
+    for btn in get_nav_buttons("menu_vms", True):
+        nav_builder.add(btn)
+    nav_builder.adjust(2)
+    builder.attach(nav_builder)
+
+    return builder
+
+
+@router.callback_query(F.data.startswith("vmall"))
+async def vm_all_panels(callback: CallbackQuery):
+    await callback.answer()
+
+    if not auth_check(callback.from_user.id):
+        return
+
+    prefix, _, page = callback.data.partition("_")
+    page = int(page or 1)
+
+    apis = await db.list_apis()
+    if not apis:
+        await show_vms_menu(callback)
+        return
+
+    text = TITLE_VM + f"_Loading VMs from {len(apis)} panel\\(s\\)\\.\\.\\._"
+    await callback.message.edit_text(text)
+
+    if prefix == "vmallr":
+        for api_config in apis:
+            api_clients.get(api_config).invalidate_cache()
+
+    entries, failed = await _load_all_panels(apis)
+    pages = max((len(entries) + VM_PAGE_SIZE - 1) // VM_PAGE_SIZE, 1)
+    page = min(max(page, 1), pages)
+
+    text = _build_all_panels_text(entries, failed, page, pages, len(apis))
+    builder = _build_all_panels_buttons(entries, page, pages)
+    await callback.message.edit_text(text, reply_markup=builder.as_markup())
+
+
 @router.callback_query(F.data == "vm_list")
 async def vm_list(callback: CallbackQuery):
     await show_vms_menu(callback)
 
 
 def _build_vm_detail_text(vm, stats, escaped_api_name, vpsid):
-    if vm["status"] == "running":
+    if vm.status == "running":
         status_text = "Running"
         status_icon = "●"
-    elif vm["status"] == "suspended":
+    elif vm.status == "suspended":
         status_text = "Suspended"
         status_icon = "◌"
     else:
         status_text = "Stopped"
         status_icon = "○"
 
-    hostname = escape_md(vm["hostname"])
-    ipv4 = escape_md(vm["ipv4"]) if vm["ipv4"] else "N/A"
-    ipv6 = escape_md(vm["ipv6"]) if vm.get("ipv6") else "N/A"
+    hostname = escape_md(vm.hostname)
+    ipv4 = escape_md(vm.ipv4) if vm.ipv4 else "N/A"
+    ipv6 = escape_md(vm.ipv6) if vm.ipv6 else "N/A"
     escaped_vpsid = escape_md(vpsid)
 
-    vcpu = vm.get("vcpu", 0)
-    ram_total = stats.get("ram_total", 0) or vm.get("ram", 0)
-    ram_used = stats.get("ram_used", 0)
-    disk_total = stats.get("disk_total", 0) or vm.get("disk", 0)
-    disk_used = stats.get("disk_used", 0)
-    bandwidth_total = stats.get("bandwidth_total", 0) or vm.get("bandwidth", 0)
-    bandwidth_used = stats.get("bandwidth_used", 0) or vm.get("used_bandwidth", 0)
-    nw_rules = stats.get("nw_rules", 0)
-    os_name = escape_md(get_os_name(vm.get("os", "")))
-    virt = escape_md(vm.get("virt", "")) if vm.get("virt") else "N/A"
+    vcpu = vm.vcpu
+    ram_total = stats.ram_total or vm.ram
+    ram_used = stats.ram_used
+    disk_total = stats.disk_total or vm.disk
+    disk_used = stats.disk_used
+    bandwidth_total = stats.bandwidth_total or vm.bandwidth
+    bandwidth_used = stats.bandwidth_used or vm.used_bandwidth
+    nw_rules = stats.nw_rules
+    os_name = escape_md(get_os_name(vm.os))
+    virt = escape_md(vm.virt) if vm.virt else "N/A"
 
     bw_bar = progress_bar(bandwidth_used, bandwidth_total)
     ram_bar = progress_bar(ram_used, ram_total)
@@ -384,7 +616,7 @@ def _build_vm_detail_text(vm, stats, escaped_api_name, vpsid):
 def _build_vm_detail_buttons(vm, api_name, vpsid):
     builder = InlineKeyboardBuilder()
 
-    if vm["status"] == "running":
+    if vm.status == "running":
         builder.row(
             InlineKeyboardButton(
                 text="Restart", callback_data=f"vmact_{api_name}_{vpsid}_restart"
@@ -399,7 +631,7 @@ def _build_vm_detail_buttons(vm, api_name, vpsid):
                 callback_data=f"vmact_{api_name}_{vpsid}_poweroff",
             )
         )
-    elif vm["status"] == "stopped":
+    elif vm.status == "stopped":
         builder.row(
             InlineKeyboardButton(
                 text="Start", callback_data=f"vmact_{api_name}_{vpsid}_start"
@@ -407,7 +639,7 @@ def _build_vm_detail_buttons(vm, api_name, vpsid):
         )
 
     builder.row(
-        InlineKeyboardButton(text="Refresh", callback_data=f"vm_{api_name}_{vpsid}")
+        InlineKeyboardButton(text="Refresh", callback_data=f"vmrf_{api_name}_{vpsid}")
     )
 
     nav_builder = InlineKeyboardBuilder()
@@ -428,8 +660,24 @@ async def vm_detail(callback: CallbackQuery):
     if len(parts) < 3:
         return
 
-    api_name = parts[1]
-    vpsid = parts[2]
+    await _show_vm_detail(callback, parts[1], parts[2])
+
+
+@router.callback_query(F.data.startswith("vmrf_"))
+async def vm_detail_refresh(callback: CallbackQuery):
+    if not auth_check(callback.from_user.id):
+        return
+
+    parts = callback.data.split("_", 2)
+    if len(parts) < 3:
+        return
+
+    await _show_vm_detail(callback, parts[1], parts[2], force=True)
+
+
+async def _show_vm_detail(
+    callback: CallbackQuery, api_name: str, vpsid: str, force: bool = False
+):
     escaped_api_name = escape_md(api_name)
 
     api_config = await db.get_api(api_name)
@@ -445,14 +693,8 @@ async def vm_detail(callback: CallbackQuery):
     await callback.message.edit_text(text)
 
     try:
-        api = VirtualizorAPI.from_db_config(api_config)
-        vms = api.list_vms()
-
-        vm = None
-        for v in vms:
-            if v["vpsid"] == vpsid:
-                vm = v
-                break
+        api = api_clients.get(api_config)
+        vm = await api.get_vm(vpsid, force=force)
 
         if not vm:
             text = (
@@ -469,10 +711,7 @@ async def vm_detail(callback: CallbackQuery):
             await callback.message.edit_text(text, reply_markup=builder.as_markup())
             return
 
-        stats = api.get_vm_stats(vpsid)
-        text = _build_vm_detail_text(vm, stats, escaped_api_name, vpsid)
-        builder = _build_vm_detail_buttons(vm, api_name, vpsid)
-        await callback.message.edit_text(text, reply_markup=builder.as_markup())
+        await _render_vm_detail(callback.message, api, api_name, vpsid, vm)
 
     except (APIConnectionError, AuthenticationError, APIError) as e:
         text = (
@@ -488,13 +727,102 @@ async def vm_detail(callback: CallbackQuery):
         await callback.message.edit_text(text, reply_markup=builder.as_markup())
 
 
-def _get_action_wait_time(action):
+async def _render_vm_detail(message, api, api_name, vpsid, vm):
+    stats = await api.get_vm_stats(vpsid)
+    text = _build_vm_detail_text(vm, stats, escape_md(api_name), vpsid)
+    builder = _build_vm_detail_buttons(vm, api_name, vpsid)
+    await message.edit_text(text, reply_markup=builder.as_markup())
+
+
+def _get_expected_status(action):
     if action in ["start", "restart"]:
-        return 30
-    elif action in ["stop", "poweroff"]:
-        return 10
-    else:
-        return 5
+        return "running"
+    return "stopped"
+
+
+def _watch_vm_status(message, api, api_name, vpsid, action):
+    key = (message.chat.id, message.message_id)
+    previous = _status_pollers.pop(key, None)
+    if previous:
+        previous.cancel()
+
+    task = asyncio.create_task(_poll_vm_status(message, api, api_name, vpsid, action))
+    _status_pollers[key] = task
+
+    def _done(t):
+        if _status_pollers.get(key) is t:
+            del _status_pollers[key]
+        if not t.cancelled() and t.exception():
+            logger.debug(f"Status poller for VM {vpsid} failed: {t.exception()}")
+
+    task.add_done_callback(_done)
+
+
+async def _poll_vm_status(message, api, api_name, vpsid, action):
+    expected = _get_expected_status(action)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + ACTION_POLL_TIMEOUT
+    delay = ACTION_POLL_INTERVAL
+    # A restarting VM can still report running before it goes down.
+    settled = action != "restart"
+    vm = None
+    reason = (
+        f"The VM has not reported {expected} after "
+        f"{escape_md(f'{ACTION_POLL_TIMEOUT:g}')} seconds\\. "
+    )
+
+    while loop.time() < deadline:
+        await asyncio.sleep(min(delay, max(deadline - loop.time(), 0)))
+        delay = min(delay * 1.5, ACTION_POLL_MAX_INTERVAL)
+        try:
+            vm = await api.get_vm(vpsid, force=True)
+        except AuthenticationError:
+            reason = "The panel rejected the API credentials while checking the VM\\. "
+            break
+        except APIError:
+            continue
+        if not vm:
+            reason = (
+                "The VM could not be found\\. "
+                "It may have been deleted or the VPS ID is invalid\\. "
+            )
+            break
+        if vm.status != expected:
+            settled = True
+            continue
+        if settled or loop.time() - started >= ACTION_POLL_MAX_INTERVAL:
+            # Lists loaded while the VM was changing state are stale now.
+            api.invalidate_cache()
+            try:
+                await _render_vm_detail(message, api, api_name, vpsid, vm)
+            except APIError:
+                reason = (
+                    f"The VM reported {expected}, but its details "
+                    "could not be loaded\\. "
+                )
+                break
+            return
+
+    current = escape_md(vm.status.title()) if vm else "Unknown"
+    text = (
+        f"*VM Action*\n"
+        "━━━━━━━━━━━━━━━━━━━━━\n\n"
+        f"*VPS ID:* `{escape_md(vpsid)}`\n"
+        f"*Action:* {escape_md(action.title())}\n"
+        f"*Status:* {current}\n\n"
+        f"{reason}Click Refresh to check again\\." + FOOTER
+    )
+    builder = InlineKeyboardBuilder()
+    builder.row(
+        InlineKeyboardButton(text="Refresh", callback_data=f"vmrf_{api_name}_{vpsid}")
+    )
+    nav_builder = InlineKeyboardBuilder()
+    for btn in get_nav_buttons(f"vmapi_{api_name}", True):
+        nav_builder.add(btn)
+    nav_builder.adjust(2)
+    builder.attach(nav_builder)
+    await message.edit_text(text, reply_markup=builder.as_markup())
 
 
 def _get_action_message(action):
@@ -581,8 +909,9 @@ async def vm_action_handler(callback: CallbackQuery):
         pass
 
     try:
-        api = VirtualizorAPI.from_db_config(api_config)
-        api.vm_action(vpsid, action)
+        api = api_clients.get(api_config)
+        await api.vm_action(vpsid, action)
+        api.invalidate_cache()
 
         action_past = {
             "start": "started",
@@ -592,7 +921,7 @@ async def vm_action_handler(callback: CallbackQuery):
         }
         action_done = action_past.get(action, action)
 
-        wait_time = _get_action_wait_time(action)
+        expected = _get_expected_status(action)
         wait_msg = _get_action_message(action)
 
         text = (
@@ -601,47 +930,12 @@ async def vm_action_handler(callback: CallbackQuery):
             f"VM successfully {action_done}\\.\n\n"
             f"*VPS ID:* `{escape_md(vpsid)}`\n"
             f"*Action:* {escape_md(action.title())}\n\n"
-            f"_Waiting {wait_time} seconds before refresh\\.\\.\\._"
+            f"_Waiting for the VM to report {expected}\\.\\.\\._"
             f"{wait_msg}"
         )
         await callback.message.edit_text(text)
 
-        await asyncio.sleep(wait_time)
-
-        text = (
-            f"*VM Action*\n"
-            "━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"VM successfully {action_done}\\.\n\n"
-            f"*VPS ID:* `{escape_md(vpsid)}`\n"
-            f"*Action:* {escape_md(action.title())}\n\n"
-            "_Refreshing VM details\\.\\.\\._"
-        )
-        await callback.message.edit_text(text)
-
-        object.__setattr__(callback, "data", f"vm_{api_name}_{vpsid}")
-        try:
-            await vm_detail(callback)
-        except Exception:
-            text = (
-                f"*VM Action*\n"
-                "━━━━━━━━━━━━━━━━━━━━━\n\n"
-                f"VM successfully {action_done}\\.\n\n"
-                f"*VPS ID:* `{escape_md(vpsid)}`\n"
-                f"*Action:* {escape_md(action.title())}\n\n"
-                "Click Refresh to see updated status\\." + FOOTER
-            )
-            builder = InlineKeyboardBuilder()
-            builder.row(
-                InlineKeyboardButton(
-                    text="Refresh", callback_data=f"vm_{api_name}_{vpsid}"
-                )
-            )
-            nav_builder = InlineKeyboardBuilder()
-            for btn in get_nav_buttons(f"vmapi_{api_name}", True):
-                nav_builder.add(btn)
-            nav_builder.adjust(2)
-            builder.attach(nav_builder)
-            await callback.message.edit_text(text, reply_markup=builder.as_markup())
+        _watch_vm_status(callback.message, api, api_name, vpsid, action)
 
     except APIError as e:
         text = (
@@ -0,0 +1,104 @@
+import asyncio
+import itertools
+import json
+
+import httpx
+import pytest
+
+import src.api.client as client_module
+from src.api import (
+    APIConnectionError,
+    CircuitBreaker,
+    PanelServerError,
+    PanelUnavailableError,
+    VirtualizorAPI,
+    breakers,
+    http_pool,
+)
+
+_urls = itertools.count()
+
+VS = {"7": {"vpsid": "7", "hostname": "web", "status": 1}}
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(client_module, "API_RETRY_BACKOFF", 0)
+
+
+def _api(handler):
+    url = f"https://panel{next(_urls)}.example.com:4085/index.php"
+    http_pool._clients[(url, False, False)] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    return VirtualizorAPI(url, "k" * 32, "secret")
+
+
+def test_breaker_opens_after_threshold_and_probes_once():
+    breaker = CircuitBreaker(threshold=2, cooldown=0)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(PanelUnavailableError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_server_errors_from_one_endpoint_do_not_open_breaker():
+    def handler(request):
+        if request.url.params["act"] == "managevdf":
+            return httpx.Response(500)
+        return httpx.Response(200, content=json.dumps({"vs": VS}))
+
+    api = _api(handler)
+
+    async def run():
+        await api.get_vm_stats("7")
+        with pytest.raises(PanelServerError):
+            await api._request("managevdf", svs="7")
+        return await api.get_vm("7", force=True)
+
+    assert asyncio.run(run()).hostname == "web"
+    assert breakers.get(api.api_url).state == CircuitBreaker.CLOSED
+
+
+def test_retries_of_one_call_count_as_one_failure():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.params["act"])
+        raise httpx.ConnectError("refused", request=request)
+
+    api = _api(handler)
+
+    with pytest.raises(APIConnectionError):
+        asyncio.run(api.get_vm("7", force=True))
+
+    breaker = breakers.get(api.api_url)
+    assert len(calls) == client_module.API_RETRIES + 1
+    assert breaker.failures == 1
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_unreachable_panel_opens_breaker_after_separate_calls():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    api = _api(handler)
+    breaker = breakers.get(api.api_url)
+
+    async def run():
+        for _ in range(breaker.threshold):
+            with pytest.raises(APIConnectionError):
+                await api.get_vm("7", force=True)
+        with pytest.raises(PanelUnavailableError):
+            await api.get_vm("7", force=True)
+
+    asyncio.run(run())
+    assert breaker.state == CircuitBreaker.OPEN
@@ -0,0 +1,50 @@
+import asyncio
+
+from src.api import InventoryCache
+
+
+def test_cache_serves_fresh_entries_without_reloading():
+    cache = InventoryCache(ttl=60, max_stale=600)
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return len(loads)
+
+    async def run():
+        first = await cache.get("k", loader)
+        second = await cache.get("k", loader)
+        forced = await cache.get("k", loader, force=True)
+        return first, second, forced
+
+    assert asyncio.run(run()) == (1, 1, 2)
+
+
+def test_stale_entry_is_served_while_refreshing():
+    cache = InventoryCache(ttl=0, max_stale=600)
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return len(loads)
+
+    async def run():
+        await cache.get("k", loader)
+        stale = await cache.get("k", loader)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return stale, cache._entries["k"][1]
+
+    assert asyncio.run(run()) == (1, 2)
+
+
+def test_invalidate_prefix_drops_matching_keys_only():
+    cache = InventoryCache()
+
+    async def run():
+        for key in [("a", 1), ("a", 1, "page", 1), ("b", 1)]:
+            await cache.get(key, lambda: asyncio.sleep(0, result=key))
+        cache.invalidate_prefix(("a", 1))
+
+    asyncio.run(run())
+    assert list(cache._entries) == [("b", 1)]
@@ -0,0 +1,20 @@
+import asyncio
+
+from src.api import SingleFlight
+
+
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["ok"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"calls": 5, "deduplicated": 4, "in_flight": 0}
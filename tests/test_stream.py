@@ -0,0 +1,45 @@
+import asyncio
+import json
+
+import pytest
+
+from src.api.stream import iter_object_members
+
+BODY = json.dumps(
+    {
+        "t": 1.5,
+        "n": -2.5e-3,
+        "big": 12345678901234567890,
+        "vs": {
+            "1": {"hostname": "a", "ram": 2048, "ratio": 0.25, "exp": 1e10},
+            "2": {"hostname": "b", "used": -7, "flag": True, "none": None},
+        },
+        "timenow": 1700000000.125,
+    }
+)
+
+
+def _members(chunks):
+    async def source():
+        for chunk in chunks:
+            yield chunk
+
+    async def collect():
+        return [item async for item in iter_object_members(source(), "vs")]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("offset", range(1, len(BODY)))
+def test_body_split_at_every_offset(offset):
+    expected = list(json.loads(BODY)["vs"].items())
+    assert _members([BODY[:offset], BODY[offset:]]) == expected
+
+
+def test_number_split_after_decimal_point():
+    assert _members(['{"t": 1.', '5, "vs": {"1": 2}}']) == [("1", 2)]
+
+
+def test_truncated_body_raises():
+    with pytest.raises(ValueError):
+        _members(['{"t": 1.'])